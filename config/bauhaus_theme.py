@@ -3,6 +3,9 @@ Bauhaus Moderno Theme - Stylesheet Generator
 Gera stylesheet QSS completo com design system Bauhaus
 """
 
+import re
+from functools import lru_cache
+
 from config.bauhaus_tokens import (
     BAUHAUS_PALETTE, BORDER_RADIUS, SPACING, TYPOGRAPHY,
     BUTTONS, INPUTS, CARDS, BADGES, TABS, MODALS, NAVBAR, TABLES
@@ -264,6 +267,12 @@ def generate_bauhaus_stylesheet() -> str:
         border: 2px solid {BAUHAUS_PALETTE['red']};
     }}
     
+    QFrame#Divider {{
+        border: none;
+        border-top: 1px solid {BAUHAUS_PALETTE['medium_gray']};
+        margin: {SPACING['md']} 0;
+    }}
+    
     QFrame#LoginCard {{
         background-color: {CARDS['background']};
         border: {CARDS['border']};
@@ -533,9 +542,20 @@ def generate_bauhaus_stylesheet() -> str:
     """
 
 
-def get_minimal_black_stylesheet() -> str:
-    """Tema minimalista: fundo #cecaca, fontes maiores, cantos arredondados 3px"""
-    return """
+# Tema minimalista: fundo #cecaca, fontes maiores, cantos arredondados 3px.
+# Constante de módulo: montada uma vez no import e reaproveitada.
+_QSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_QSS_SPACE_RE = re.compile(r"\s*([{};:,])\s*")
+
+
+def _compile_qss(qss: str) -> str:
+    """Pré-processa o QSS uma única vez: remove comentários e espaços redundantes"""
+    qss = _QSS_COMMENT_RE.sub("", qss)
+    qss = _QSS_SPACE_RE.sub(r"\1", qss)
+    return " ".join(qss.split())
+
+
+_MINIMAL_BLACK_STYLESHEET = """
     /* MINIMAL THEME - Fundo principal #cecaca, bordas #333, fontes maiores */
     QWidget {
         background-color: #cecaca;
@@ -681,6 +701,12 @@ def get_minimal_black_stylesheet() -> str:
         background-color: #ffffff;
     }
     
+    QFrame#Divider {
+        border: none;
+        border-top: 1px solid #D6D6D6;
+        margin: 16px 0;
+    }
+    
     /* ScrollBars */
     QScrollBar:vertical {
         background: #ffffff;
@@ -745,6 +771,39 @@ def get_minimal_black_stylesheet() -> str:
     }
     """
 
+# Regras usadas só na sidebar: aplicadas ao nav_frame, fora do sheet global,
+# para não serem avaliadas contra os widgets de todas as páginas
+_MINIMAL_SIDEBAR_STYLESHEET = """
+    /* Navegação: o QButtonGroup exclusivo mantém um único botão :checked */
+    QPushButton#NavButton:checked {
+        background-color: #1a1a1a;
+        border: 2px solid #000000;
+    }
+    
+    /* Badge de contagem de alertas */
+    QLabel#BadgeError {
+        color: #ffffff;
+        background-color: #cc0000;
+        border-radius: 3px;
+        padding: 0px 6px;
+        font-size: 13px;
+    }
+    """
+
+_MINIMAL_BLACK_STYLESHEET_COMPILED = _compile_qss(_MINIMAL_BLACK_STYLESHEET)
+_MINIMAL_SIDEBAR_STYLESHEET_COMPILED = _compile_qss(_MINIMAL_SIDEBAR_STYLESHEET)
+
+
+def get_minimal_black_stylesheet() -> str:
+    """Tema minimalista: fundo #cecaca, fontes maiores, cantos arredondados 3px"""
+    return _MINIMAL_BLACK_STYLESHEET_COMPILED
+
+
+def get_minimal_sidebar_stylesheet() -> str:
+    """Regras da sidebar do tema minimalista (aplicar no frame da sidebar)"""
+    return _MINIMAL_SIDEBAR_STYLESHEET_COMPILED
+
+@lru_cache(maxsize=None)
 def get_bauhaus_stylesheet() -> str:
-    """Retorna o stylesheet Bauhaus completo"""
-    return generate_bauhaus_stylesheet()
+    """Retorna o stylesheet Bauhaus completo (gerado uma única vez)"""
+    return _compile_qss(generate_bauhaus_stylesheet())
@@ -196,6 +196,9 @@ LOG_BACKUP_COUNT = 5
 ENABLE_DRM = True
 SIGNATURE_VERIFICATION = True
 INTEGRITY_CHECK = True
+PASSWORD_HASH_CACHE_ENABLED = False  # Manter hashes PBKDF2 recentes em memória
+PASSWORD_HASH_CACHE_TTL = 300  # segundos
+PASSWORD_HASH_CACHE_SIZE = 1024
 
 # Desenvolvimento
 DEBUG_MODE = False
@@ -9,6 +9,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 from PySide6.QtWidgets import QApplication
 
 from config.config import APP_NAME, APP_VERSION, APP_DATA_DIR
+from config.bauhaus_theme import get_minimal_black_stylesheet
 from src.core import DatabaseManager, AuthManager, CameraManager
 from src.core.alert_manager import AlertManager
 from src.ui.tray_app import TrayApp, EngineManager
@@ -42,6 +43,8 @@ def main():
     app = QApplication(sys.argv)
     app.setApplicationName(APP_NAME)
     app.setApplicationVersion(APP_VERSION)
+    # Stylesheet aplicado uma única vez, antes de qualquer widget existir
+    app.setStyleSheet(get_minimal_black_stylesheet())
 
     if app_settings.get("enable_tray", True):
         app.setQuitOnLastWindowClosed(False)
@@ -11,6 +11,8 @@ from typing import List, Optional
 from pathlib import Path
 import threading
 
+from PySide6.QtCore import QObject, Signal
+
 from config.ui_theme import PALETTE, color_for_severity
 
 logger = logging.getLogger(__name__)
@@ -189,6 +191,12 @@ class EmailNotifier:
                     raise
 
 
+class AlertManagerSignals(QObject):
+    """Sinais do AlertManager (entregues na thread da UI)"""
+    unacknowledged_changed = Signal(int)
+    new_alert = Signal(object)
+
+
 class AlertManager:
     """Gerencia alertas e regras com validação de eventos e fila de email"""
 
@@ -198,8 +206,11 @@ class AlertManager:
         self.email_queue = email_queue  # EmailQueue instance
         self.rules: dict = {}
         self.active_alerts: List[Alert] = []
+        self._unacknowledged_count = 0  # mantido incrementalmente sob self.lock
+        self._last_alert_id = 0
         self.email_notifier: Optional[EmailNotifier] = None
         self.lock = threading.Lock()
+        self.signals = AlertManagerSignals()
 
     def load_rules(self, camera_id: int):
         """Carrega regras do banco de dados"""
@@ -245,6 +256,11 @@ class AlertManager:
 
             with self.lock:
                 self.active_alerts.append(alert)
+                self._unacknowledged_count += 1
+                self._last_alert_id = alert_id
+                count = self._unacknowledged_count
+            self.signals.unacknowledged_changed.emit(count)
+            self.signals.new_alert.emit(alert)
 
             # Enviar notificação por email via fila (não bloqueia)
             if self.email_queue and self.email_notifier:
@@ -294,11 +310,18 @@ class AlertManager:
         """Marca um alerta como reconhecido"""
         try:
             self.db.acknowledge_alert(alert_id)
+            changed = False
             with self.lock:
                 for alert in self.active_alerts:
                     if alert.alert_id == alert_id:
-                        alert.acknowledged = True
+                        if not alert.acknowledged:
+                            alert.acknowledged = True
+                            self._unacknowledged_count -= 1
+                            changed = True
                         break
+                count = self._unacknowledged_count
+            if changed:
+                self.signals.unacknowledged_changed.emit(count)
             logger.info(f"Alerta {alert_id} reconhecido")
         except Exception as e:
             logger.error(f"Erro ao reconhecer alerta: {e}")
@@ -308,15 +331,32 @@ class AlertManager:
         with self.lock:
             return self.active_alerts.copy()
 
+    @property
+    def active_unacknowledged_count(self) -> int:
+        """Quantidade de alertas ativos ainda não reconhecidos (O(1))"""
+        return self._unacknowledged_count
+
+    def get_alert_signature(self) -> tuple:
+        """Retorna (não reconhecidos, id do último alerta) para detectar mudanças em O(1)"""
+        with self.lock:
+            return self._unacknowledged_count, self._last_alert_id
+
     def clear_old_alerts(self, days: int = 7):
         """Remove alertas antigos"""
         try:
             cutoff_time = datetime.now() - timedelta(days=days)
             with self.lock:
+                previous = self._unacknowledged_count
                 self.active_alerts = [
                     alert for alert in self.active_alerts
                     if alert.timestamp > cutoff_time
                 ]
+                self._unacknowledged_count = sum(
+                    1 for alert in self.active_alerts if not alert.acknowledged
+                )
+                count = self._unacknowledged_count
+            if count != previous:
+                self.signals.unacknowledged_changed.emit(count)
             logger.info(f"Alertas antigos removidos (> {days} dias)")
         except Exception as e:
             logger.error(f"Erro ao limpar alertas antigos: {e}")
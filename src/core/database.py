@@ -4,7 +4,7 @@ Gerenciador de banco de dados SQLite
 import sqlite3
 import logging
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+from typing import Iterator, List, Dict, Optional, Tuple
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -21,8 +21,13 @@ class DatabaseManager:
     def connect(self):
         """Conecta ao banco de dados"""
         try:
-            self.connection = sqlite3.connect(str(self.db_path))
+            # cached_statements: reaproveita statements já compilados (consultas quentes)
+            self.connection = sqlite3.connect(str(self.db_path), cached_statements=256)
             self.connection.row_factory = sqlite3.Row
+            # WAL permite leituras da UI enquanto licenças/eventos são gravados
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+            self.connection.execute("PRAGMA temp_store=MEMORY")
             logger.info(f"Conectado ao banco de dados: {self.db_path}")
         except sqlite3.Error as e:
             logger.error(f"Erro ao conectar ao banco de dados: {e}")
@@ -140,6 +145,13 @@ class DatabaseManager:
                 FOREIGN KEY (user_id) REFERENCES users(id)
             )
         """)
+        self._ensure_column("licenses", "expiration_epoch", "INTEGER")
+        # Preencher epoch de licenças antigas (expiration_date está em hora local)
+        cursor.execute("""
+            UPDATE licenses
+            SET expiration_epoch = CAST(strftime('%s', expiration_date, 'utc') AS INTEGER)
+            WHERE expiration_epoch IS NULL
+        """)
 
         # Tabela de Logs
         cursor.execute("""
@@ -239,6 +251,17 @@ class DatabaseManager:
             )
         """)
         self.connection.commit()
+
+        # Colunas de revisão usadas pelo histórico de alertas
+        self._ensure_column("events", "is_real", "BOOLEAN")
+        self._ensure_column("events", "snapshot_path", "TEXT")
+
+        # Índice da consulta filtrada do histórico (ordenada por timestamp)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_events_ts_desc
+            ON events(timestamp DESC, event_type, camera_id, is_real)
+        """)
+        self.connection.commit()
         logger.info("Banco de dados inicializado com sucesso")
 
     def _ensure_column(self, table: str, column: str, definition: str):
@@ -263,6 +286,21 @@ class DatabaseManager:
             logger.error(f"Erro ao executar query: {e}")
             raise
 
+    def execute_query_iter(self, query: str, params: tuple = (),
+                           chunk_size: int = 1000) -> Iterator[List[sqlite3.Row]]:
+        """Executa uma query SELECT devolvendo as linhas em blocos"""
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute(query, params)
+            while True:
+                chunk = cursor.fetchmany(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        except sqlite3.Error as e:
+            logger.error(f"Erro ao executar query: {e}")
+            raise
+
     def execute_update(self, query: str, params: tuple = ()) -> int:
         """Executa uma query INSERT/UPDATE/DELETE"""
         try:
@@ -276,6 +314,19 @@ class DatabaseManager:
             raise
 
     # Operações de Câmeras
+
+    def execute_many(self, query: str, params_seq) -> int:
+        """Executa o mesmo INSERT/UPDATE/DELETE para vários parâmetros numa transação"""
+        try:
+            cursor = self.connection.cursor()
+            cursor.executemany(query, params_seq)
+            self.connection.commit()
+            return cursor.rowcount
+        except sqlite3.Error as e:
+            logger.error(f"Erro ao executar update em lote: {e}")
+            self.connection.rollback()
+            raise
+
     def add_camera(self, user_id: int, name: str, rtsp_url: str) -> int:
         """Adiciona uma nova câmera"""
         query = """
@@ -382,10 +433,14 @@ class DatabaseManager:
                     expiration_date: datetime, is_trial: bool = False) -> int:
         """Adiciona uma licença"""
         query = """
-            INSERT INTO licenses (user_id, license_key, camera_limit, expiration_date, is_trial)
-            VALUES (?, ?, ?, ?, ?)
+            INSERT INTO licenses
+            (user_id, license_key, camera_limit, expiration_date, expiration_epoch, is_trial)
+            VALUES (?, ?, ?, ?, ?, ?)
         """
-        return self.execute_update(query, (user_id, license_key, camera_limit, expiration_date, is_trial))
+        return self.execute_update(query, (
+            user_id, license_key, camera_limit, expiration_date,
+            int(expiration_date.timestamp()), is_trial
+        ))
 
     def get_license(self, user_id: int) -> Optional[sqlite3.Row]:
         """Obtém a licença ativa do usuário"""
@@ -398,6 +453,18 @@ class DatabaseManager:
         result = self.execute_query(query, (user_id,))
         return result[0] if result else None
 
+    def get_license_bundle(self, user_id: int) -> Optional[sqlite3.Row]:
+        """Obtém, em uma única consulta, os campos de licença usados pela aplicação"""
+        query = """
+            SELECT license_key, camera_limit, expiration_date, expiration_epoch, is_trial
+            FROM licenses
+            WHERE user_id = ? AND expiration_date > CURRENT_TIMESTAMP
+            ORDER BY expiration_date DESC
+            LIMIT 1
+        """
+        result = self.execute_query(query, (user_id,))
+        return result[0] if result else None
+
     def is_license_valid(self, user_id: int) -> bool:
         """Verifica se a licença do usuário é válida"""
         license = self.get_license(user_id)
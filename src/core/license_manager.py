@@ -2,10 +2,12 @@
 Gerenciador unificado de licenças (Local + Microsoft Store)
 """
 import logging
+import time
 from datetime import datetime, timedelta
 from typing import Optional, Dict
-import hashlib
 import json
+import secrets
+import sqlite3
 from config.config import (
     TRIAL_DURATION_DAYS,
     FREE_CAMERA_LIMIT,
@@ -21,10 +23,18 @@ logger = logging.getLogger(__name__)
 class LicenseManager:
     """Gerencia licenças unificando Store e local"""
 
+    # Tempo (segundos) em que a licença lida do banco é reaproveitada
+    LICENSE_CACHE_TTL = 1.0
+    # Tempo (segundos) em que a mensagem de upgrade é reaproveitada
+    UPGRADE_MESSAGE_TTL = 60.0
+
     def __init__(self, db_manager, use_store: bool = None):
         self.db = db_manager
         self.use_store = use_store if use_store is not None else IS_STORE_BUILD
         self.store_provider = None
+        self._verified_keys = set()
+        self._license_cache = {}
+        self._upgrade_message_cache = {}
         
         # Inicializar Store provider se necessário
         if self.use_store:
@@ -42,15 +52,23 @@ class LicenseManager:
             from config.config import TRIAL_DURATION_DAYS, TRIAL_CAMERA_LIMIT
 
             expiration_date = datetime.now() + timedelta(days=TRIAL_DURATION_DAYS)
-            license_key = self._generate_license_key(user_id, is_trial=True)
 
-            self.db.add_license(
-                user_id=user_id,
-                license_key=license_key,
-                camera_limit=TRIAL_CAMERA_LIMIT,
-                expiration_date=expiration_date,
-                is_trial=True
-            )
+            # license_key é UNIQUE: em caso (improvável) de colisão, gerar outra
+            for attempt in range(3):
+                license_key = self._generate_license_key(user_id, is_trial=True)
+                try:
+                    self.db.add_license(
+                        user_id=user_id,
+                        license_key=license_key,
+                        camera_limit=TRIAL_CAMERA_LIMIT,
+                        expiration_date=expiration_date,
+                        is_trial=True
+                    )
+                    break
+                except sqlite3.IntegrityError:
+                    if attempt == 2:
+                        raise
+            self._invalidate_license(user_id)
 
             logger.info(f"Licença trial criada para usuário {user_id}")
             return True
@@ -61,61 +79,65 @@ class LicenseManager:
 
     def validate_license(self, user_id: int) -> bool:
         """Valida a licença do usuário (Store ou local)"""
+        # Store licensing tem prioridade
+        if self.use_store and self.store_provider:
+            return self.store_provider.is_license_valid()
+
+        # Fallback para licença local
         try:
-            # Store licensing tem prioridade
-            if self.use_store and self.store_provider:
-                return self.store_provider.is_license_valid()
-            
-            # Fallback para licença local
-            license = self.db.get_license(user_id)
-            if not license:
-                logger.warning(f"Licença não encontrada para usuário {user_id}")
-                return False
+            license = self._load_license(user_id)
+        except sqlite3.Error as e:
+            logger.error(f"Erro ao validar licença: {e}")
+            return False
 
-            if datetime.fromisoformat(license['expiration_date']) < datetime.now():
-                logger.warning(f"Licença expirada para usuário {user_id}")
-                return False
+        if not license:
+            logger.warning(f"Licença não encontrada para usuário {user_id}")
+            return False
 
-            logger.info(f"Licença válida para usuário {user_id}")
-            return True
+        try:
+            expired = self._expiration_epoch(license) < int(time.time())
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            logger.error(f"Licença com expiração inválida para usuário {user_id}: {e}")
+            return False
 
-        except Exception as e:
-            logger.error(f"Erro ao validar licença: {e}")
+        if expired:
+            logger.warning(f"Licença expirada para usuário {user_id}")
             return False
 
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Licença válida para usuário {user_id}")
+        return True
+
     def check_camera_limit(self, user_id: int, current_cameras: int) -> bool:
         """Verifica se o usuário pode adicionar mais câmeras"""
-        try:
-            limit = self.get_camera_limit(user_id)
-            
-            if current_cameras >= limit:
-                logger.warning(
-                    f"Limite de câmeras atingido para usuário {user_id}: "
-                    f"{current_cameras}/{limit}"
-                )
-                return False
+        limit = self.get_camera_limit(user_id)
+
+        if current_cameras >= limit:
+            logger.warning(
+                f"Limite de câmeras atingido para usuário {user_id}: "
+                f"{current_cameras}/{limit}"
+            )
+            return False
 
+        if logger.isEnabledFor(logging.INFO):
             logger.info(f"Usuário {user_id} pode adicionar mais câmeras ({current_cameras}/{limit})")
-            return True
+        return True
 
-        except Exception as e:
-            logger.error(f"Erro ao verificar limite de câmeras: {e}")
-            return False
-    
     def get_camera_limit(self, user_id: int) -> int:
         """Obtém limite de câmeras (Store ou local)"""
+        # Store licensing tem prioridade
+        if self.use_store and self.store_provider:
+            return self.store_provider.get_available_cameras()
+
+        # Fallback para limite local
         try:
-            # Store licensing tem prioridade
-            if self.use_store and self.store_provider:
-                return self.store_provider.get_available_cameras()
-            
-            # Fallback para limite local
-            return self.db.get_camera_limit(user_id)
-            
-        except Exception as e:
+            license = self._load_license(user_id)
+        except sqlite3.Error as e:
             logger.error(f"Erro ao obter limite de câmeras: {e}")
             return FREE_CAMERA_LIMIT  # Retornar limite free como fallback
 
+        return license['camera_limit'] if license else 0
+
     def get_license_info(self, user_id: int) -> Optional[Dict]:
         """Obtém informações da licença (Store ou local)"""
         try:
@@ -131,30 +153,44 @@ class LicenseManager:
                 }
             
             # Licença local
-            license = self.db.get_license(user_id)
+            license = self._load_license(user_id)
             if not license:
                 return None
 
-            expiration = datetime.fromisoformat(license['expiration_date'])
-            days_remaining = (expiration - datetime.now()).days
-
-            return {
-                'source': 'local',
-                'license_key': license['license_key'],
-                'camera_limit': license['camera_limit'],
-                'expiration_date': license['expiration_date'],
-                'days_remaining': max(0, days_remaining),
-                'is_trial': bool(license['is_trial']),
-                'is_valid': days_remaining > 0,
-                'status': 'Trial (Local)' if license['is_trial'] else 'Active (Local)'
-            }
+            return self._build_local_info(license, int(time.time()))
 
         except Exception as e:
             logger.error(f"Erro ao obter informações de licença: {e}")
             return None
+
+    def _build_local_info(self, license, now_epoch: int) -> Dict:
+        """Monta o dicionário de informações de uma licença local"""
+        days_remaining = (self._expiration_epoch(license) - now_epoch) // 86400
+
+        return {
+            'source': 'local',
+            'license_key': license['license_key'],
+            'camera_limit': license['camera_limit'],
+            'expiration_date': license['expiration_date'],
+            'days_remaining': max(0, days_remaining),
+            'is_trial': bool(license['is_trial']),
+            'is_valid': days_remaining > 0,
+            'status': 'Trial (Local)' if license['is_trial'] else 'Active (Local)'
+        }
     
     def get_upgrade_message(self, user_id: int) -> str:
         """Retorna mensagem de upgrade se necessário"""
+        now = time.monotonic()
+        cached = self._upgrade_message_cache.get(user_id)
+        if cached is not None and now - cached[1] < self.UPGRADE_MESSAGE_TTL:
+            return cached[0]
+
+        message = self._build_upgrade_message(user_id)
+        self._upgrade_message_cache[user_id] = (message, now)
+        return message
+
+    def _build_upgrade_message(self, user_id: int) -> str:
+        """Monta a mensagem de upgrade a partir da licença atual"""
         info = self.get_license_info(user_id)
         
         if not info:
@@ -175,16 +211,38 @@ class LicenseManager:
         
         return "Plano Enterprise ativo."
 
+    def _load_license(self, user_id: int):
+        """Lê a licença do banco, reaproveitando a leitura por LICENSE_CACHE_TTL"""
+        now = time.monotonic()
+        cached = self._license_cache.get(user_id)
+        if cached is not None and now - cached[1] < self.LICENSE_CACHE_TTL:
+            return cached[0]
+
+        license = self.db.get_license_bundle(user_id)
+        self._license_cache[user_id] = (license, now)
+        return license
+
+    def _invalidate_license(self, user_id: int):
+        """Descarta a licença e a mensagem de upgrade em cache após alterações"""
+        self._license_cache.pop(user_id, None)
+        self._upgrade_message_cache.pop(user_id, None)
+
+    @staticmethod
+    def _expiration_epoch(license) -> int:
+        """Retorna a expiração como epoch, calculando-a para linhas antigas"""
+        try:
+            epoch = license['expiration_epoch']
+        except (KeyError, IndexError):
+            epoch = None
+
+        if epoch is None:
+            epoch = int(datetime.fromisoformat(str(license['expiration_date'])).timestamp())
+        return epoch
+
     def _generate_license_key(self, user_id: int, is_trial: bool = False) -> str:
         """Gera uma chave de licença"""
-        timestamp = datetime.now().isoformat()
         trial_str = "TRIAL" if is_trial else "COMMERCIAL"
-
-        data = f"{user_id}-{timestamp}-{trial_str}"
-        hash_obj = hashlib.sha256(data.encode())
-        license_key = f"{trial_str}-{hash_obj.hexdigest()[:16].upper()}"
-
-        return license_key
+        return f"{trial_str}-{secrets.token_hex(8).upper()}"
 
     def verify_license_key(self, license_key: str) -> bool:
         """Verifica se uma chave de licença é válida"""
@@ -193,12 +251,22 @@ class LicenseManager:
             if not license_key or len(license_key) < 20:
                 return False
 
+            # Chaves já verificadas nesta sessão não precisam ir ao banco
+            if license_key in self._verified_keys:
+                return True
+
             # Aqui você implementaria verificação com servidor de licenças
             # Por enquanto, apenas verificar se existe no banco de dados
-            query = "SELECT * FROM licenses WHERE license_key = ?"
-            result = self.db.execute_query(query, (license_key,))
+            # (license_key é UNIQUE, então a busca usa o índice da coluna)
+            query = "SELECT 1 FROM licenses WHERE license_key = ? LIMIT 1"
+            found = bool(self.db.execute_query(query, (license_key,)))
+
+            if found:
+                if len(self._verified_keys) >= 512:
+                    self._verified_keys.clear()
+                self._verified_keys.add(license_key)
 
-            return len(result) > 0
+            return found
 
         except Exception as e:
             logger.error(f"Erro ao verificar chave de licença: {e}")
@@ -221,6 +289,7 @@ class LicenseManager:
                 expiration_date=expiration_date,
                 is_trial=False
             )
+            self._invalidate_license(user_id)
 
             logger.info(f"Licença ativada para usuário {user_id}")
             return True
@@ -232,7 +301,7 @@ class LicenseManager:
     def renew_license(self, user_id: int, duration_months: int = 12) -> bool:
         """Renova uma licença existente"""
         try:
-            license = self.db.get_license(user_id)
+            license = self._load_license(user_id)
             if not license:
                 logger.warning(f"Licença não encontrada para usuário {user_id}")
                 return False
@@ -242,8 +311,14 @@ class LicenseManager:
             new_expiration = current_expiration + timedelta(days=duration_months * 30)
 
             # Atualizar licença
-            query = "UPDATE licenses SET expiration_date = ? WHERE user_id = ?"
-            self.db.execute_update(query, (new_expiration.isoformat(), user_id))
+            query = """
+                UPDATE licenses SET expiration_date = ?, expiration_epoch = ?
+                WHERE user_id = ?
+            """
+            self.db.execute_update(query, (
+                new_expiration.isoformat(), int(new_expiration.timestamp()), user_id
+            ))
+            self._invalidate_license(user_id)
 
             logger.info(f"Licença renovada para usuário {user_id}")
             return True
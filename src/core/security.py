@@ -2,14 +2,73 @@
 Módulo de segurança e DRM
 """
 import logging
+import base64
 import hashlib
 import hmac
+import mmap
+import os
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 import json
 
+from config.config import (
+    PASSWORD_HASH_CACHE_ENABLED,
+    PASSWORD_HASH_CACHE_TTL,
+    PASSWORD_HASH_CACHE_SIZE
+)
+from src.core.dpapi_security import DpapiSecurity
+
 logger = logging.getLogger(__name__)
 
+# Cache (password, salt) -> (hash, expira_em); só usado se habilitado em config
+_pbkdf2_cache = {}
+
+
+def _pbkdf2(password: str, salt: str) -> str:
+    """PBKDF2-HMAC-SHA256 com cache opcional de curta duração"""
+    if not PASSWORD_HASH_CACHE_ENABLED:
+        return _pbkdf2_compute(password, salt)
+
+    key = (password, salt)
+    now = time.monotonic()
+    cached = _pbkdf2_cache.get(key)
+    if cached is not None and cached[1] > now:
+        return cached[0]
+
+    digest = _pbkdf2_compute(password, salt)
+    if len(_pbkdf2_cache) >= PASSWORD_HASH_CACHE_SIZE:
+        # Descartar entradas expiradas; se ainda cheio, limpar tudo
+        for expired in [k for k, (_, exp) in _pbkdf2_cache.items() if exp <= now]:
+            del _pbkdf2_cache[expired]
+        if len(_pbkdf2_cache) >= PASSWORD_HASH_CACHE_SIZE:
+            _pbkdf2_cache.clear()
+    _pbkdf2_cache[key] = (digest, now + PASSWORD_HASH_CACHE_TTL)
+    return digest
+
+
+def _pbkdf2_compute(password: str, salt: str) -> str:
+    return hashlib.pbkdf2_hmac(
+        'sha256',
+        password.encode('utf-8'),
+        salt.encode('utf-8'),
+        100000
+    ).hex()
+
+
+@lru_cache(maxsize=256)
+def _license_signature_matches(license_key: str, signature: str) -> bool:
+    """HMAC da chave de licença comparado em tempo constante (resultado memoizado)"""
+    key = b"microsoft_store_key"
+    expected_signature = hmac.new(key, license_key.encode(), hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected_signature, signature)
+
+
+@lru_cache(maxsize=4096)
+def _sha256_hex(value: str) -> str:
+    return hashlib.sha256(value.encode()).hexdigest()
+
 
 class SecurityManager:
     """Gerencia segurança da aplicação"""
@@ -18,6 +77,33 @@ class SecurityManager:
         self.app_dir = app_dir
         self.integrity_file = app_dir / ".integrity"
         self.drm_file = app_dir / ".drm"
+        self.data_key_file = app_dir / ".data_key"
+        self._data_key: Optional[bytes] = None
+
+    def _get_data_key(self) -> bytes:
+        """Chave AES-256 desta instalação, gerada no primeiro uso e guardada protegida por DPAPI"""
+        if self._data_key is not None:
+            return self._data_key
+
+        dpapi = DpapiSecurity()
+        if self.data_key_file.exists():
+            key_b64 = dpapi.decrypt_credential(self.data_key_file.read_text().strip())
+            if not key_b64:
+                # Não gerar outra: os dados já cifrados ficariam ilegíveis
+                raise ValueError("Chave de dados não pôde ser recuperada")
+            self._data_key = base64.b64decode(key_b64)
+            return self._data_key
+
+        key = os.urandom(32)
+        # Sem DPAPI (fora do Windows) a chave fica em base64, legível só pelo dono do arquivo
+        protected = dpapi.encrypt_credential(base64.b64encode(key).decode('ascii'))
+        if not protected:
+            raise ValueError("Falha ao proteger a chave de dados")
+        self.app_dir.mkdir(parents=True, exist_ok=True)
+        self.data_key_file.write_text(protected)
+        os.chmod(self.data_key_file, 0o600)
+        self._data_key = key
+        return key
 
     def verify_application_integrity(self) -> bool:
         """Verifica integridade da aplicação"""
@@ -80,8 +166,16 @@ class SecurityManager:
         """Cria hash de integridade para um arquivo"""
         try:
             with open(file_path, 'rb') as f:
-                file_hash = hashlib.sha256(f.read()).hexdigest()
-            return file_hash
+                # file_digest (Python 3.11+) faz o streaming em C via OpenSSL
+                if hasattr(hashlib, 'file_digest'):
+                    return hashlib.file_digest(f, 'sha256').hexdigest()
+
+                # Sem file_digest: mapear o arquivo evita cópias para bytes
+                file_hash = hashlib.sha256()
+                if os.fstat(f.fileno()).st_size > 0:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        file_hash.update(mapped)
+            return file_hash.hexdigest()
 
         except Exception as e:
             logger.error(f"Erro ao criar hash: {e}")
@@ -91,30 +185,41 @@ class SecurityManager:
         """Verifica assinatura de um arquivo"""
         try:
             file_hash = self.create_integrity_hash(file_path)
-            return file_hash == signature
+            return bool(file_hash) and hmac.compare_digest(file_hash, signature)
 
         except Exception as e:
             logger.error(f"Erro ao verificar assinatura: {e}")
             return False
 
     def encrypt_sensitive_data(self, data: str) -> str:
-        """Criptografa dados sensíveis"""
+        """Criptografa dados sensíveis (AES-256-GCM, nonce + ciphertext em base64)"""
         try:
-            # Usar HMAC para criptografia simples
-            key = b"edge_security_ai_key_2024"
-            encrypted = hmac.new(key, data.encode(), hashlib.sha256).hexdigest()
-            return encrypted
+            from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+            nonce = os.urandom(12)
+            ciphertext = AESGCM(self._get_data_key()).encrypt(nonce, data.encode('utf-8'), None)
+            return base64.b64encode(nonce + ciphertext).decode('ascii')
+
+        except ImportError:
+            logger.error("cryptography não instalado. Use: pip install cryptography")
+            return ""
 
         except Exception as e:
             logger.error(f"Erro ao criptografar dados: {e}")
             return ""
 
     def decrypt_sensitive_data(self, encrypted_data: str) -> Optional[str]:
-        """Descriptografa dados sensíveis"""
+        """Descriptografa dados gerados por encrypt_sensitive_data"""
         try:
-            # HMAC não é reversível, apenas para verificação
-            # Para dados sensíveis reais, use AES ou similar
-            return encrypted_data
+            from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+            raw = base64.b64decode(encrypted_data)
+            nonce, ciphertext = raw[:12], raw[12:]
+            return AESGCM(self._get_data_key()).decrypt(nonce, ciphertext, None).decode('utf-8')
+
+        except ImportError:
+            logger.error("cryptography não instalado. Use: pip install cryptography")
+            return None
 
         except Exception as e:
             logger.error(f"Erro ao descriptografar dados: {e}")
@@ -123,9 +228,7 @@ class SecurityManager:
     def validate_license_signature(self, license_key: str, signature: str) -> bool:
         """Valida assinatura de licença"""
         try:
-            key = b"microsoft_store_key"
-            expected_signature = hmac.new(key, license_key.encode(), hashlib.sha256).hexdigest()
-            return hmac.compare_digest(expected_signature, signature)
+            return _license_signature_matches(license_key, signature)
 
         except Exception as e:
             logger.error(f"Erro ao validar assinatura de licença: {e}")
@@ -141,12 +244,7 @@ class DataEncryption:
         if salt is None:
             salt = "edge_security_ai_salt_2024"
 
-        return hashlib.pbkdf2_hmac(
-            'sha256',
-            password.encode('utf-8'),
-            salt.encode('utf-8'),
-            100000
-        ).hex()
+        return _pbkdf2(password, salt)
 
     @staticmethod
     def verify_password(password: str, password_hash: str) -> bool:
@@ -156,7 +254,7 @@ class DataEncryption:
     @staticmethod
     def encrypt_email(email: str) -> str:
         """Criptografa email para armazenamento"""
-        return hashlib.sha256(email.encode()).hexdigest()
+        return _sha256_hex(email)
 
     @staticmethod
     def mask_email(email: str) -> str:
@@ -8,6 +8,15 @@ import asyncio
 
 logger = logging.getLogger(__name__)
 
+# Marca o StoreContext ainda não inicializado (None significa indisponível)
+_UNINITIALIZED = object()
+
+
+def _parse_addon_key(addon_key: str) -> tuple:
+    """Extrai (câmeras, meses) de um addon key como '5_cameras_3months'"""
+    cameras, _, duration = addon_key.split('_')
+    return int(cameras), int(duration.removesuffix('months').removesuffix('month'))
+
 
 class StoreLicenseProvider:
     """Provedor de licenças integrado com Microsoft Store"""
@@ -25,6 +34,12 @@ class StoreLicenseProvider:
         '10_cameras_12months': 'EdgeAI-10Cam-12M',
     }
 
+    # Consultas simultâneas de add-ons à Store
+    ADDON_QUERY_CONCURRENCY = 4
+
+    # addon key -> (câmeras, meses), calculado uma única vez
+    ADDON_META = {key: _parse_addon_key(key) for key in ADDON_IDS}
+
     def __init__(self, is_store_build: bool = False):
         """
         Inicializa provedor de licenças
@@ -33,12 +48,19 @@ class StoreLicenseProvider:
             is_store_build: True se rodando como MSIX da Store
         """
         self.is_store_build = is_store_build
-        self.store_context = None
+        # winsdk é carregado apenas na primeira consulta à Store (_ensure_context)
+        self.store_context = _UNINITIALIZED if is_store_build else None
         self.app_license = None
         self.addon_licenses = {}
 
-        if is_store_build:
+        self._update_cached_state()
+
+    def _ensure_context(self):
+        """Inicializa o StoreContext na primeira utilização"""
+        if self.store_context is _UNINITIALIZED:
+            self.store_context = None
             self._initialize_store_context()
+            self._update_cached_state()
 
     def _initialize_store_context(self):
         """Inicializa contexto da Store"""
@@ -70,6 +92,7 @@ class StoreLicenseProvider:
         Returns:
             Dicionário com informações de licença ou None
         """
+        self._ensure_context()
         if not self.is_store_build or self.store_context is None:
             return self._get_trial_license()
 
@@ -89,6 +112,7 @@ class StoreLicenseProvider:
 
             logger.info(f"Licença do app obtida: {license_info['type']}")
             self.app_license = license_info
+            self._update_cached_state()
             return license_info
 
         except Exception as e:
@@ -102,28 +126,36 @@ class StoreLicenseProvider:
         Returns:
             Dicionário com informações de add-ons
         """
+        self._ensure_context()
         if not self.is_store_build or self.store_context is None:
             return self._get_trial_addons()
 
         try:
             addon_licenses = {}
+            semaphore = asyncio.Semaphore(self.ADDON_QUERY_CONCURRENCY)
+
+            async def fetch(addon_key: str, addon_id: str):
+                async with semaphore:
+                    try:
+                        return addon_key, await self.store_context.get_addon_license_async(addon_id)
+                    except Exception as e:
+                        logger.debug(f"Add-on {addon_id} não disponível: {e}")
+                        return addon_key, None
+
+            results = await asyncio.gather(
+                *(fetch(addon_key, addon_id) for addon_key, addon_id in self.ADDON_IDS.items())
+            )
 
-            for addon_key, addon_id in self.ADDON_IDS.items():
-                try:
-                    addon_license = await self.store_context.get_addon_license_async(addon_id)
-
-                    if addon_license and addon_license.is_active:
-                        addon_info = {
-                            'addon_id': addon_id,
-                            'is_active': addon_license.is_active,
-                            'expiration_date': addon_license.expiration_date.isoformat() if addon_license.expiration_date else None,
-                            'cameras': self._parse_camera_count(addon_key),
-                            'duration_months': self._parse_duration(addon_key)
-                        }
-                        addon_licenses[addon_key] = addon_info
-
-                except Exception as e:
-                    logger.debug(f"Add-on {addon_id} não disponível: {e}")
+            for addon_key, addon_license in results:
+                if addon_license and addon_license.is_active:
+                    cameras, months = self.ADDON_META[addon_key]
+                    addon_licenses[addon_key] = {
+                        'addon_id': self.ADDON_IDS[addon_key],
+                        'is_active': addon_license.is_active,
+                        'expiration_date': addon_license.expiration_date.isoformat() if addon_license.expiration_date else None,
+                        'cameras': cameras,
+                        'duration_months': months
+                    }
 
             logger.info(f"Add-ons obtidos: {len(addon_licenses)}")
             self.addon_licenses = addon_licenses
@@ -155,26 +187,34 @@ class StoreLicenseProvider:
 
     def is_license_valid(self) -> bool:
         """Verifica se licença é válida"""
-        if not self.is_store_build:
-            return True  # Trial sempre válido
-
-        if self.app_license is None:
-            return False
-
-        return self.app_license.get('is_active', False)
+        if self.store_context is _UNINITIALIZED:
+            self._ensure_context()
+        return self._valid_cached
 
     def get_license_status(self) -> str:
         """Retorna status legível da licença"""
-        if not self.is_store_build:
-            return "Trial (Local)"
+        if self.store_context is _UNINITIALIZED:
+            self._ensure_context()
+        return self._status_cached
 
-        if not self.is_license_valid():
-            return "Expired"
+    def _update_cached_state(self):
+        """Recalcula validade e status; chamado quando a licença muda"""
+        if not self.is_store_build:
+            self._valid_cached = True  # Trial sempre válido
+            self._status_cached = "Trial (Local)"
+            return
 
-        if self.app_license.get('is_trial'):
-            return "Trial (Store)"
+        if self.app_license is None:
+            self._valid_cached = False
+        else:
+            self._valid_cached = bool(self.app_license.get('is_active', False))
 
-        return "Active (Store)"
+        if not self._valid_cached:
+            self._status_cached = "Expired"
+        elif self.app_license.get('is_trial'):
+            self._status_cached = "Trial (Store)"
+        else:
+            self._status_cached = "Active (Store)"
 
     def _get_trial_license(self) -> Dict:
         """Retorna licença trial padrão"""
@@ -201,28 +241,6 @@ class StoreLicenseProvider:
             }
         }
 
-    @staticmethod
-    def _parse_camera_count(addon_key: str) -> int:
-        """Extrai número de câmeras do addon key"""
-        if '2_cameras' in addon_key:
-            return 2
-        elif '5_cameras' in addon_key:
-            return 5
-        elif '10_cameras' in addon_key:
-            return 10
-        return 2
-
-    @staticmethod
-    def _parse_duration(addon_key: str) -> int:
-        """Extrai duração em meses do addon key"""
-        if '1month' in addon_key:
-            return 1
-        elif '3months' in addon_key:
-            return 3
-        elif '12months' in addon_key:
-            return 12
-        return 1
-
 
 class LicenseGate:
     """Portão de licença para gating de funcionalidades"""
@@ -266,21 +284,39 @@ class LicenseGate:
 class AsyncLicenseManager:
     """Gerenciador de licenças com suporte async"""
 
+    # Tempo (segundos) em que uma consulta à Store continua válida
+    REFRESH_TTL = 300
+
     def __init__(self, is_store_build: bool = False):
         self.provider = StoreLicenseProvider(is_store_build)
         self.gate = LicenseGate(self.provider)
         self.last_check = None
+        self._refresh_lock = asyncio.Lock()
 
-    async def refresh(self):
-        """Atualiza informações de licença"""
-        try:
-            await self.provider.get_app_license()
-            await self.provider.get_addon_licenses()
-            self.last_check = datetime.now()
-            logger.info("Licenças atualizadas")
+    def _is_fresh(self) -> bool:
+        """Indica se a última consulta ainda está dentro do TTL"""
+        if self.last_check is None:
+            return False
+        return (datetime.now() - self.last_check).total_seconds() < self.REFRESH_TTL
 
-        except Exception as e:
-            logger.error(f"Erro ao atualizar licenças: {e}")
+    async def refresh(self, force: bool = False):
+        """Atualiza informações de licença (respeitando o TTL)"""
+        if not force and self._is_fresh():
+            return
+
+        # Chamadas concorrentes aguardam a mesma atualização
+        async with self._refresh_lock:
+            if not force and self._is_fresh():
+                return
+
+            try:
+                await self.provider.get_app_license()
+                await self.provider.get_addon_licenses()
+                self.last_check = datetime.now()
+                logger.info("Licenças atualizadas")
+
+            except Exception as e:
+                logger.error(f"Erro ao atualizar licenças: {e}")
 
     async def is_valid(self) -> bool:
         """Verifica se licença é válida"""
@@ -289,6 +325,14 @@ class AsyncLicenseManager:
 
     async def get_status(self) -> Dict:
         """Obtém status completo de licença"""
+        return await self.get_full_state()
+
+    async def get_full_state(self) -> Dict:
+        """
+        Obtém validade, status e câmeras com uma única atualização
+
+        Prefira este método a chamar is_valid() e get_status() em sequência.
+        """
         await self.refresh()
 
         return {
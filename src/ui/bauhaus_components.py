@@ -11,98 +11,112 @@ from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
 
 from config.bauhaus_tokens import (
-    BAUHAUS_PALETTE, BORDER_RADIUS, SPACING, TYPOGRAPHY,
+    BORDER_RADIUS, SPACING, TYPOGRAPHY,
     BUTTONS, INPUTS, BADGES
 )
 
 
+# Fontes compartilhadas (QFont é implicitamente compartilhada / copy-on-write)
+def _make_font(point_size: int, weight=None) -> QFont:
+    font = QFont()
+    font.setPointSize(point_size)
+    if weight is not None:
+        font.setWeight(weight)
+    return font
+
+
+_FONT_11 = _make_font(11)
+_FONT_10_DEMIBOLD = _make_font(10, QFont.Weight.DemiBold)
+_FONT_18_BOLD = _make_font(18, QFont.Weight.Bold)
+_FONT_24_BOLD = _make_font(24, QFont.Weight.Bold)
+_BUTTON_FONT = _make_font(11, QFont.Weight.DemiBold)
+
+
+def _apply_input_style(widget, placeholder: str = None, min_height: int = 44):
+    """Aplica fonte, altura mínima e placeholder de um input em uma só chamada"""
+    widget.setFont(_FONT_11)
+    widget.setMinimumHeight(min_height)
+    if placeholder:
+        widget.setPlaceholderText(placeholder)
+
+
+# Densidade dos layouts derivada dos tokens (ponto único de ajuste)
+def _px(token: str) -> int:
+    return int(SPACING[token].rstrip("px"))
+
+
+_CARD_MARGINS = _px("lg")
+_CARD_SPACING = _px("md")
+_FIELD_SPACING = _px("sm")
+
+
+def _configure_layout(parent, layout_cls=QVBoxLayout, margins: int = _CARD_MARGINS,
+                      spacing: int = _CARD_SPACING):
+    """Cria o layout já instalado em parent, com margens e espaçamento Bauhaus"""
+    layout = layout_cls(parent)
+    layout.setContentsMargins(margins, margins, margins, margins)
+    layout.setSpacing(spacing)
+    return layout
+
+
+def _use_styled_background(widget):
+    """Fundo pintado só pelo QSS (#Card/#StatCard), sem preenchimento extra da paleta"""
+    widget.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+    widget.setAutoFillBackground(False)
+
+
+class _BauhausFontMixin:
+    """Aplica a fonte compartilhada definida em _FONT"""
+
+    _FONT = _FONT_11
+
+    def setup_style(self):
+        self.setFont(self._FONT)
+
+
 # ============================================================================
 # BOTÕES
 # ============================================================================
 
 class BauhausButton(QPushButton):
-    """Botão primário Bauhaus"""
-    
-    def __init__(self, text: str = "", parent=None):
+    """Botão Bauhaus (primary, secondary, danger, highlight ou ghost)"""
+
+    _OBJECT_NAMES = {
+        "primary": "BauhausButton",
+        "secondary": "SecondaryButton",
+        "danger": "DangerButton",
+        "highlight": "HighlightButton",
+        "ghost": "GhostButton",
+    }
+
+    def __init__(self, text: str = "", parent=None, variant: str = "primary"):
         super().__init__(text, parent)
-        self.setObjectName("BauhausButton")
+        self.setObjectName(self._OBJECT_NAMES[variant])
         self.setup_style()
-    
+
     def setup_style(self):
-        self.setMinimumHeight(44)
-        self.setMinimumWidth(100)
-        font = QFont()
-        font.setPointSize(11)
-        font.setWeight(QFont.Weight.DemiBold)
-        self.setFont(font)
+        self.setMinimumSize(100, 44)
+        self.setFont(_BUTTON_FONT)
 
 
-class BauhausSecondaryButton(QPushButton):
-    """Botão secundário Bauhaus"""
-    
+class BauhausSecondaryButton(BauhausButton):
     def __init__(self, text: str = "", parent=None):
-        super().__init__(text, parent)
-        self.setObjectName("SecondaryButton")
-        self.setup_style()
-    
-    def setup_style(self):
-        self.setMinimumHeight(44)
-        self.setMinimumWidth(100)
-        font = QFont()
-        font.setPointSize(11)
-        font.setWeight(QFont.Weight.DemiBold)
-        self.setFont(font)
+        super().__init__(text, parent, variant="secondary")
 
 
-class BauhausDangerButton(QPushButton):
-    """Botão destrutivo Bauhaus"""
-    
+class BauhausDangerButton(BauhausButton):
     def __init__(self, text: str = "", parent=None):
-        super().__init__(text, parent)
-        self.setObjectName("DangerButton")
-        self.setup_style()
-    
-    def setup_style(self):
-        self.setMinimumHeight(44)
-        self.setMinimumWidth(100)
-        font = QFont()
-        font.setPointSize(11)
-        font.setWeight(QFont.Weight.DemiBold)
-        self.setFont(font)
+        super().__init__(text, parent, variant="danger")
 
 
-class BauhausHighlightButton(QPushButton):
-    """Botão de destaque Bauhaus"""
-    
+class BauhausHighlightButton(BauhausButton):
     def __init__(self, text: str = "", parent=None):
-        super().__init__(text, parent)
-        self.setObjectName("HighlightButton")
-        self.setup_style()
-    
-    def setup_style(self):
-        self.setMinimumHeight(44)
-        self.setMinimumWidth(100)
-        font = QFont()
-        font.setPointSize(11)
-        font.setWeight(QFont.Weight.DemiBold)
-        self.setFont(font)
+        super().__init__(text, parent, variant="highlight")
 
 
-class BauhausGhostButton(QPushButton):
-    """Botão ghost Bauhaus (transparente com borda)"""
-    
+class BauhausGhostButton(BauhausButton):
     def __init__(self, text: str = "", parent=None):
-        super().__init__(text, parent)
-        self.setObjectName("GhostButton")
-        self.setup_style()
-    
-    def setup_style(self):
-        self.setMinimumHeight(44)
-        self.setMinimumWidth(100)
-        font = QFont()
-        font.setPointSize(11)
-        font.setWeight(QFont.Weight.DemiBold)
-        self.setFont(font)
+        super().__init__(text, parent, variant="ghost")
 
 
 # ============================================================================
@@ -114,14 +128,7 @@ class BauhausLineEdit(QLineEdit):
     
     def __init__(self, placeholder: str = "", parent=None):
         super().__init__(parent)
-        self.setPlaceholderText(placeholder)
-        self.setMinimumHeight(44)
-        self.setup_style()
-    
-    def setup_style(self):
-        font = QFont()
-        font.setPointSize(11)
-        self.setFont(font)
+        _apply_input_style(self, placeholder)
 
 
 class BauhausTextEdit(QTextEdit):
@@ -129,13 +136,7 @@ class BauhausTextEdit(QTextEdit):
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setMinimumHeight(100)
-        self.setup_style()
-    
-    def setup_style(self):
-        font = QFont()
-        font.setPointSize(11)
-        self.setFont(font)
+        _apply_input_style(self, min_height=100)
 
 
 class BauhausComboBox(QComboBox):
@@ -143,13 +144,7 @@ class BauhausComboBox(QComboBox):
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setMinimumHeight(44)
-        self.setup_style()
-    
-    def setup_style(self):
-        font = QFont()
-        font.setPointSize(11)
-        self.setFont(font)
+        _apply_input_style(self)
 
 
 class BauhausSpinBox(QSpinBox):
@@ -157,13 +152,7 @@ class BauhausSpinBox(QSpinBox):
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setMinimumHeight(44)
-        self.setup_style()
-    
-    def setup_style(self):
-        font = QFont()
-        font.setPointSize(11)
-        self.setFont(font)
+        _apply_input_style(self)
 
 
 class BauhausDoubleSpinBox(QDoubleSpinBox):
@@ -171,13 +160,7 @@ class BauhausDoubleSpinBox(QDoubleSpinBox):
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setMinimumHeight(44)
-        self.setup_style()
-    
-    def setup_style(self):
-        font = QFont()
-        font.setPointSize(11)
-        self.setFont(font)
+        _apply_input_style(self)
 
 
 # ============================================================================
@@ -190,13 +173,11 @@ class BauhausCard(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setObjectName("Card")
+        _use_styled_background(self)
         self.setup_style()
     
     def setup_style(self):
-        layout = QVBoxLayout()
-        layout.setContentsMargins(24, 24, 24, 24)
-        layout.setSpacing(16)
-        self.setLayout(layout)
+        _configure_layout(self)
 
 
 class BauhausStatCard(QFrame):
@@ -205,6 +186,7 @@ class BauhausStatCard(QFrame):
     def __init__(self, title: str = "", value: str = "", parent=None):
         super().__init__(parent)
         self.setObjectName("StatCard")
+        _use_styled_background(self)
         self.title_label = QLabel(title)
         self.title_label.setObjectName("StatTitle")
         self.value_label = QLabel(value)
@@ -212,13 +194,10 @@ class BauhausStatCard(QFrame):
         self.setup_style()
     
     def setup_style(self):
-        layout = QVBoxLayout()
-        layout.setContentsMargins(24, 24, 24, 24)
-        layout.setSpacing(8)
+        layout = _configure_layout(self, spacing=_FIELD_SPACING)
         layout.addWidget(self.title_label)
         layout.addWidget(self.value_label)
         layout.addStretch()
-        self.setLayout(layout)
     
     def set_value(self, value: str):
         """Atualiza o valor exibido"""
@@ -230,8 +209,10 @@ class BauhausStatCard(QFrame):
     
     def set_alert(self, is_alert: bool):
         """Define se o card está em estado de alerta"""
-        self.setProperty("alert", "true" if is_alert else "false")
-        self.style().unpolish(self)
+        value = "true" if is_alert else "false"
+        if self.property("alert") == value:
+            return
+        self.setProperty("alert", value)
         self.style().polish(self)
 
 
@@ -239,34 +220,26 @@ class BauhausStatCard(QFrame):
 # LABELS E BADGES
 # ============================================================================
 
-class BauhausPageTitle(QLabel):
+class BauhausPageTitle(_BauhausFontMixin, QLabel):
     """Título de página Bauhaus"""
+
+    _FONT = _FONT_24_BOLD
     
     def __init__(self, text: str = "", parent=None):
         super().__init__(text, parent)
         self.setObjectName("PageTitle")
         self.setup_style()
-    
-    def setup_style(self):
-        font = QFont()
-        font.setPointSize(24)
-        font.setWeight(QFont.Weight.Bold)
-        self.setFont(font)
 
 
-class BauhausSectionTitle(QLabel):
+class BauhausSectionTitle(_BauhausFontMixin, QLabel):
     """Título de seção Bauhaus"""
+
+    _FONT = _FONT_18_BOLD
     
     def __init__(self, text: str = "", parent=None):
         super().__init__(text, parent)
         self.setObjectName("SectionTitle")
         self.setup_style()
-    
-    def setup_style(self):
-        font = QFont()
-        font.setPointSize(18)
-        font.setWeight(QFont.Weight.Bold)
-        self.setFont(font)
 
 
 class BauhausBadge(QLabel):
@@ -279,17 +252,16 @@ class BauhausBadge(QLabel):
         self.setup_style()
     
     def setup_style(self):
-        font = QFont()
-        font.setPointSize(10)
-        font.setWeight(QFont.Weight.DemiBold)
-        self.setFont(font)
+        self.setFont(_FONT_10_DEMIBOLD)
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
     
     def set_type(self, badge_type: str):
         """Define o tipo de badge (success, error, warning, info)"""
+        object_name = f"Badge{badge_type.capitalize()}"
         self.badge_type = badge_type
-        self.setObjectName(f"Badge{badge_type.capitalize()}")
-        self.style().unpolish(self)
+        if self.objectName() == object_name:
+            return
+        self.setObjectName(object_name)
         self.style().polish(self)
 
 
@@ -303,10 +275,7 @@ class BauhausContainer(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setObjectName("Container")
-        layout = QVBoxLayout()
-        layout.setContentsMargins(24, 24, 24, 24)
-        layout.setSpacing(16)
-        self.setLayout(layout)
+        _configure_layout(self)
     
     def add_widget(self, widget):
         """Adiciona um widget ao container"""
@@ -323,10 +292,7 @@ class BauhausHorizontalContainer(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setObjectName("HorizontalContainer")
-        layout = QHBoxLayout()
-        layout.setContentsMargins(24, 24, 24, 24)
-        layout.setSpacing(16)
-        self.setLayout(layout)
+        _configure_layout(self, QHBoxLayout)
     
     def add_widget(self, widget):
         """Adiciona um widget ao container"""
@@ -342,56 +308,86 @@ class BauhausHorizontalContainer(QFrame):
 # ============================================================================
 
 class BauhausFormField(QFrame):
-    """Campo de formulário com label e input"""
+    """Campo de formulário com label e input de texto
+
+    Outros tipos de input: BauhausTextAreaField, BauhausComboField,
+    BauhausSpinField e BauhausDoubleField, ou create() escolhendo pelo nome.
+    """
+
+    _INPUT_CLS = BauhausLineEdit
     
-    def __init__(self, label: str = "", input_type: str = "text", parent=None):
+    def __init__(self, label: str = "", parent=None):
         super().__init__(parent)
         self.label = QLabel(label)
         self.label.setObjectName("FormLabel")
-        
-        if input_type == "text":
-            self.input = BauhausLineEdit()
-        elif input_type == "textarea":
-            self.input = BauhausTextEdit()
-        elif input_type == "combo":
-            self.input = BauhausComboBox()
-        elif input_type == "spin":
-            self.input = BauhausSpinBox()
-        elif input_type == "double":
-            self.input = BauhausDoubleSpinBox()
-        else:
-            self.input = BauhausLineEdit()
-        
+        self.input = self._INPUT_CLS()
         self.setup_style()
+
+    @staticmethod
+    def create(label: str = "", input_type: str = "text", parent=None) -> "BauhausFormField":
+        """Cria o campo do tipo pedido ("text", "textarea", "combo", "spin", "double")"""
+        return _FIELD_CLASSES.get(input_type, BauhausFormField)(label, parent)
     
     def setup_style(self):
-        layout = QVBoxLayout()
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(8)
+        layout = _configure_layout(self, margins=0, spacing=_FIELD_SPACING)
         layout.addWidget(self.label)
         layout.addWidget(self.input)
-        self.setLayout(layout)
     
     def get_value(self):
         """Retorna o valor do input"""
-        if hasattr(self.input, 'text'):
-            return self.input.text()
-        elif hasattr(self.input, 'toPlainText'):
-            return self.input.toPlainText()
-        elif hasattr(self.input, 'value'):
-            return self.input.value()
-        elif hasattr(self.input, 'currentText'):
-            return self.input.currentText()
-        return None
+        return self.input.text()
     
     def set_value(self, value):
         """Define o valor do input"""
-        if hasattr(self.input, 'setText'):
-            self.input.setText(str(value))
-        elif hasattr(self.input, 'setPlainText'):
-            self.input.setPlainText(str(value))
-        elif hasattr(self.input, 'setValue'):
-            self.input.setValue(value)
+        self.input.setText(str(value))
+
+
+class BauhausTextAreaField(BauhausFormField):
+    """Campo de formulário com área de texto"""
+    _INPUT_CLS = BauhausTextEdit
+
+    def get_value(self):
+        return self.input.toPlainText()
+
+    def set_value(self, value):
+        self.input.setPlainText(str(value))
+
+
+class BauhausComboField(BauhausFormField):
+    """Campo de formulário com seleção"""
+    _INPUT_CLS = BauhausComboBox
+
+    def get_value(self):
+        return self.input.currentText()
+
+    def set_value(self, value):
+        self.input.setCurrentText(str(value))
+
+
+class BauhausSpinField(BauhausFormField):
+    """Campo de formulário com número inteiro"""
+    _INPUT_CLS = BauhausSpinBox
+
+    def get_value(self):
+        return self.input.value()
+
+    def set_value(self, value):
+        self.input.setValue(value)
+
+
+class BauhausDoubleField(BauhausSpinField):
+    """Campo de formulário com número decimal"""
+    _INPUT_CLS = BauhausDoubleSpinBox
+
+
+# Tipo desconhecido cai no campo de texto
+_FIELD_CLASSES = {
+    "text": BauhausFormField,
+    "textarea": BauhausTextAreaField,
+    "combo": BauhausComboField,
+    "spin": BauhausSpinField,
+    "double": BauhausDoubleField,
+}
 
 
 # ============================================================================
@@ -405,11 +401,5 @@ class BauhausDivider(QFrame):
         super().__init__(parent)
         self.setFrameShape(QFrame.Shape.HLine)
         self.setFrameShadow(QFrame.Shadow.Sunken)
-        self.setStyleSheet(f"""
-            QFrame {{
-                border: none;
-                border-top: 1px solid {BAUHAUS_PALETTE['medium_gray']};
-                margin: {SPACING['md']} 0;
-            }}
-        """)
+        self.setObjectName("Divider")  # estilo em QFrame#Divider no tema central
         self.setMaximumHeight(1)
@@ -3,19 +3,22 @@ Janela principal da aplicação
 """
 import sys
 import logging
+from functools import partial
 from pathlib import Path
 from typing import Optional
 
 from PySide6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QStackedWidget,
-    QPushButton, QLabel, QStatusBar, QFrame, QMenuBar, QMenu
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QStackedWidget,
+    QPushButton, QLabel, QStatusBar, QFrame, QMenuBar, QMenu, QButtonGroup,
+    QSizePolicy
 )
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QThreadPool, QTimer
 from PySide6.QtGui import QIcon, QFont, QAction
 
 from config.config import APP_NAME, APP_VERSION, WINDOW_WIDTH, WINDOW_HEIGHT
-from config.bauhaus_theme import get_minimal_black_stylesheet
+from config.bauhaus_theme import get_minimal_black_stylesheet, get_minimal_sidebar_stylesheet
 from config.ui_theme import get_app_stylesheet
+from src.ui.bauhaus_components import BauhausBadge
 from src.ui.pages.login_page import LoginPage
 from src.ui.pages.dashboard_page import DashboardPage
 from src.ui.pages.cameras_page import CamerasPage, SettingsPage
@@ -28,10 +31,45 @@ from src.ui.pages.profile_page import ProfilePage
 
 logger = logging.getLogger(__name__)
 
+# Botoes da sidebar: (rotulo, page_id, botao de perigo)
+_PAGES_INFO = (
+    ("Dashboard", "dashboard", False),
+    ("Live", "live", False),
+    ("Cameras", "cameras", False),
+    # ("Zones", "zones", False),  # TODO: Implementar
+    ("Alerts", "alerts", False),
+    ("Diagnostics", "diagnostics", False),
+    ("Profile", "profile", False),
+    ("Settings", "settings", False),
+    ("Logout", "logout", True),
+)
+_NAV_ID_TO_PAGE = tuple(page_id for _, page_id, _ in _PAGES_INFO)
+
+# No PySide6 os ConnectionType nao se combinam com "|" diretamente
+_UNIQUE_QUEUED = Qt.ConnectionType(
+    Qt.ConnectionType.QueuedConnection.value | Qt.ConnectionType.UniqueConnection.value
+)
+
 
 class MainWindow(QMainWindow):
     """Janela principal da aplicação"""
 
+    # page_id -> (metodo de atualizacao da pagina, titulo)
+    # live nao tem refresh: o stream e tratado por start_stream()
+    _NAV_TABLE = {
+        "dashboard": ("refresh", "Dashboard"),
+        "live": (None, "Live View"),
+        "cameras": ("refresh", "Cameras"),
+        "alerts": ("load_alerts", "Alerts"),
+        "diagnostics": ("refresh_diagnostics", "Diagnostics"),
+        "profile": ("load_profile", "Profile"),
+        "settings": ("refresh", "Settings"),
+    }
+
+    # Paginas que so recarregam quando marcadas como sujas (sinais de dados ou
+    # troca de usuario); as demais mostram estado ao vivo e sempre atualizam
+    _DIRTY_TRACKED = frozenset({"alerts", "profile"})
+
     def __init__(self, auth_manager, db_manager, alert_manager, camera_manager, engine_manager, app_settings):
         super().__init__()
         self.auth_manager = auth_manager
@@ -42,6 +80,17 @@ class MainWindow(QMainWindow):
         self.app_settings = app_settings
         self.tray_app = None
         self.allow_close = False
+        self._last_alert_count = 0
+        self._alert_signal_connected = False
+        self._clean_pages = set()
+        self._new_alert_count = 0  # alertas recebidos desde a ultima visita a Alerts
+        self._last_new_alert = None
+
+        # Rajadas de alertas (varias cameras) viram uma unica atualizacao da UI
+        self._coalesce_timer = QTimer(self)
+        self._coalesce_timer.setSingleShot(True)
+        self._coalesce_timer.setInterval(250)
+        self._coalesce_timer.timeout.connect(self._flush_new_alerts)
 
         self.setWindowTitle(f"{APP_NAME} v{APP_VERSION}")
         self.setGeometry(100, 100, WINDOW_WIDTH, WINDOW_HEIGHT)
@@ -50,11 +99,6 @@ class MainWindow(QMainWindow):
         self.setup_ui()
         self.apply_stylesheet()
 
-        # Timer para verificar alertas
-        self.alert_timer = QTimer()
-        self.alert_timer.timeout.connect(self.check_alerts)
-        self.alert_timer.start(5000)  # Verificar a cada 5 segundos
-
         logger.info("Janela principal inicializada")
     
     def create_menu_bar(self):
@@ -73,34 +117,40 @@ class MainWindow(QMainWindow):
         view_menu = menubar.addMenu("View")
         
         dashboard_action = QAction("Dashboard", self)
-        dashboard_action.triggered.connect(lambda: self.navigate_to("dashboard"))
+        dashboard_action.setData("dashboard")
+        dashboard_action.triggered.connect(self._on_menu_navigate)
         view_menu.addAction(dashboard_action)
         
         cameras_action = QAction("Cameras", self)
-        cameras_action.triggered.connect(lambda: self.navigate_to("cameras"))
+        cameras_action.setData("cameras")
+        cameras_action.triggered.connect(self._on_menu_navigate)
         view_menu.addAction(cameras_action)
         
         alerts_action = QAction("Alerts", self)
-        alerts_action.triggered.connect(lambda: self.navigate_to("alerts"))
+        alerts_action.setData("alerts")
+        alerts_action.triggered.connect(self._on_menu_navigate)
         view_menu.addAction(alerts_action)
         
         view_menu.addSeparator()
         
         diagnostics_action = QAction("Diagnostics", self)
-        diagnostics_action.triggered.connect(lambda: self.navigate_to("diagnostics"))
+        diagnostics_action.setData("diagnostics")
+        diagnostics_action.triggered.connect(self._on_menu_navigate)
         view_menu.addAction(diagnostics_action)
         
         # Settings Menu
         settings_menu = menubar.addMenu("Settings")
         
         profile_action = QAction("Profile", self)
-        profile_action.triggered.connect(lambda: self.navigate_to("profile"))
+        profile_action.setData("profile")
+        profile_action.triggered.connect(self._on_menu_navigate)
         settings_menu.addAction(profile_action)
         
         settings_menu.addSeparator()
         
         config_action = QAction("Configuration", self)
-        config_action.triggered.connect(lambda: self.navigate_to("settings"))
+        config_action.setData("settings")
+        config_action.triggered.connect(self._on_menu_navigate)
         settings_menu.addAction(config_action)
         
         # Help Menu
@@ -110,9 +160,13 @@ class MainWindow(QMainWindow):
         about_action.triggered.connect(self.show_about)
         help_menu.addAction(about_action)
     
+    def _on_menu_navigate(self):
+        """Slot unico das acoes de navegacao do menu (page_id em QAction.data())"""
+        self.navigate_to(self.sender().data())
+
     def show_about(self):
         """Mostra informações sobre o app na barra de status"""
-        self.statusBar().showMessage(f"{APP_NAME} v{APP_VERSION} - AI-powered security monitoring", 5000)
+        self._status_show(f"{APP_NAME} v{APP_VERSION} - AI-powered security monitoring", 5000)
 
     def setup_ui(self):
         """Configura a interface do usuario"""
@@ -132,6 +186,8 @@ class MainWindow(QMainWindow):
         # Sidebar
         self.nav_frame = QFrame()
         self.nav_frame.setObjectName("Sidebar")
+        # Seletores exclusivos da sidebar ficam restritos a esta subarvore
+        self.nav_frame.setStyleSheet(get_minimal_sidebar_stylesheet())
         nav_container = QVBoxLayout()
         nav_container.setContentsMargins(20, 20, 20, 20)
         nav_container.setSpacing(12)
@@ -145,31 +201,32 @@ class MainWindow(QMainWindow):
         self.nav_buttons = {}
         self.nav_labels = {}
 
-        pages_info = [
-            ("Dashboard", "dashboard"),
-            ("Live", "live"),
-            ("Cameras", "cameras"),
-            # ("Zones", "zones"),  # TODO: Implementar
-            ("Alerts", "alerts"),
-            ("Diagnostics", "diagnostics"),
-            ("Profile", "profile"),
-            ("Settings", "settings"),
-            ("Logout", "logout"),
-        ]
-
-        for label, page_id in pages_info:
+        # Grupo exclusivo: o Qt desmarca os demais botoes sozinho
+        self.nav_group = QButtonGroup(self)
+        self.nav_group.setExclusive(True)
+        self._nav_id_to_page = _NAV_ID_TO_PAGE
+
+        for nav_id, (label, page_id, danger) in enumerate(_PAGES_INFO):
             btn = QPushButton(label)
-            if page_id == "logout":
-                btn.setCheckable(False)
-                btn.setObjectName("NavButtonDanger")
-            else:
-                btn.setCheckable(True)
-                btn.setObjectName("NavButton")
-            btn.clicked.connect(lambda checked, p=page_id: self.navigate_to_page(p))
+            btn.setCheckable(not danger)
+            btn.setObjectName("NavButtonDanger" if danger else "NavButton")
+            self.nav_group.addButton(btn, nav_id)
             nav_layout.addWidget(btn)
             self.nav_buttons[page_id] = btn
             self.nav_labels[page_id] = label
 
+        self.nav_group.idClicked.connect(self._on_nav_id_clicked)
+
+        # Badge fixo dentro do botao de alertas: atualizar a contagem nao
+        # altera o texto do botao nem exige repolish
+        alerts_btn = self.nav_buttons["alerts"]
+        badge_layout = QHBoxLayout(alerts_btn)
+        badge_layout.setContentsMargins(0, 0, 8, 0)
+        badge_layout.addStretch()
+        self.alert_badge = BauhausBadge("", "error")
+        self.alert_badge.hide()
+        badge_layout.addWidget(self.alert_badge)
+
         nav_container.addLayout(nav_layout)
         nav_container.addStretch()
         self.nav_frame.setLayout(nav_container)
@@ -209,55 +266,38 @@ class MainWindow(QMainWindow):
         self.login_page.login_successful.connect(self.on_login_success)
         self.stacked_widget.addWidget(self.login_page)
 
-        # Pagina de dashboard
-        self.dashboard_page = DashboardPage(self.db_manager, self.alert_manager)
-        self.stacked_widget.addWidget(self.dashboard_page)
-
-        # Pagina de live view
-        self.live_view_page = LiveViewPage(
-            self.db_manager,
-            self.auth_manager,
-            self.camera_manager,
-            self.engine_manager
-        )
-        self.stacked_widget.addWidget(self.live_view_page)
-
-        # Pagina de cameras
-        self.cameras_page = CamerasPage(
-            self.db_manager,
-            self.auth_manager,
-            self.camera_manager,
-            self.engine_manager
-        )
-        self.stacked_widget.addWidget(self.cameras_page)
-
-        # Pagina de alertas
-        self.alerts_page = AlertsHistoryPage(self.db_manager, self.camera_manager)
-        self.stacked_widget.addWidget(self.alerts_page)
-
-        # Pagina de diagnosticos
-        self.diagnostics_page = DiagnosticsPage(
-            self.db_manager,
-            self.camera_manager,
-            self.alert_manager
-        )
-        self.stacked_widget.addWidget(self.diagnostics_page)
-
-        # Pagina de configuracoes
-        self.settings_page = SettingsPage(
-            self.db_manager,
-            self.auth_manager,
-            self.app_settings,
-            self
-        )
-        self.stacked_widget.addWidget(self.settings_page)
-
-        # Pagina de perfil
-        self.profile_page = ProfilePage(
-            self.db_manager,
-            self.auth_manager
-        )
-        self.stacked_widget.addWidget(self.profile_page)
+        # Demais paginas sao construidas sob demanda na primeira navegacao
+        self._pages = {}
+        self._nav_entries = {}
+        self._prebuild_queue = []
+        self._page_factories = {
+            "dashboard": lambda: DashboardPage(self.db_manager, self.alert_manager),
+            "live": lambda: LiveViewPage(
+                self.db_manager,
+                self.auth_manager,
+                self.camera_manager,
+                self.engine_manager
+            ),
+            "cameras": lambda: CamerasPage(
+                self.db_manager,
+                self.auth_manager,
+                self.camera_manager,
+                self.engine_manager
+            ),
+            "alerts": lambda: AlertsHistoryPage(self.db_manager, self.camera_manager),
+            "diagnostics": lambda: DiagnosticsPage(
+                self.db_manager,
+                self.camera_manager,
+                self.alert_manager
+            ),
+            "settings": lambda: SettingsPage(
+                self.db_manager,
+                self.auth_manager,
+                self.app_settings,
+                self
+            ),
+            "profile": lambda: ProfilePage(self.db_manager, self.auth_manager),
+        }
 
         content_layout.addWidget(self.stacked_widget, 1)
         content_frame.setLayout(content_layout)
@@ -266,13 +306,60 @@ class MainWindow(QMainWindow):
         # Barra de status
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
-        self.status_bar.showMessage("Ready")
+        self._status_show = self.status_bar.showMessage
+        self._status_show("Ready")
 
         central_widget.setLayout(main_layout)
 
         # Mostrar pagina de login inicialmente
         self.show_login_page()
 
+        # Dashboard e o primeiro destino apos o login: constroi quando o
+        # loop de eventos ficar ocioso, fora do caminho do primeiro paint
+        QTimer.singleShot(0, partial(self.get_page, "dashboard"))
+
+    def get_page(self, page_id: str) -> QWidget:
+        """Retorna a pagina, construindo-a na primeira chamada"""
+        page = self._pages.get(page_id)
+        if page is None:
+            page = self._page_factories[page_id]()
+            self._pages[page_id] = page
+            # Paginas fora de vista nao entram no calculo de tamanho do stack
+            page.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Ignored)
+            self.stacked_widget.addWidget(page)
+            if page_id == "cameras":
+                page.cameras_changed.connect(self._on_cameras_changed)
+        return page
+
+    @property
+    def live_view_page(self):
+        return self.get_page("live")
+
+    def _show_page(self, page):
+        """Troca a pagina visivel do stack
+
+        O QStackedLayout agrega sizeHint/minimumSize de todas as paginas;
+        com politica Ignored nas ocultas, so a pagina atual e considerada.
+        """
+        previous = self.stacked_widget.currentWidget()
+        if previous is page:
+            return
+        if previous is not None:
+            previous.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Ignored)
+        page.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
+        self.stacked_widget.setCurrentWidget(page)
+
+    def _build_nav_entry(self, page_id: str):
+        """Resolve (pagina, refresh ligado, titulo) uma unica vez por pagina"""
+        spec = self._NAV_TABLE.get(page_id)
+        if spec is None:
+            return None
+        refresh_name, title = spec
+        page = self.get_page(page_id)
+        entry = (page, getattr(page, refresh_name) if refresh_name else None, title)
+        self._nav_entries[page_id] = entry
+        return entry
+
     def set_tray_app(self, tray_app):
         """Attach tray app for notifications."""
         self.tray_app = tray_app
@@ -298,33 +385,81 @@ class MainWindow(QMainWindow):
 
     def apply_stylesheet(self):
         """Aplica estilos CSS"""
-        # Tema minimalista preto/branco/cinza
-        self.setStyleSheet(get_minimal_black_stylesheet())
+        # Tema minimalista preto/branco/cinza (constante de modulo em bauhaus_theme)
+        # main.py ja instala o sheet no QApplication na partida; aqui so cobre
+        # outros pontos de entrada (testes, scripts) sem reaplicar o mesmo sheet
+        stylesheet = get_minimal_black_stylesheet()
+        app = QApplication.instance()
+        if app.styleSheet() != stylesheet:
+            app.setStyleSheet(stylesheet)
 
     def _set_alert_indicator(self, count: int):
-        alert_btn = self.nav_buttons.get("alerts")
-        if not alert_btn:
+        if count == self._last_alert_count:
             return
+        self._last_alert_count = count
 
-        if count > 0:
-            alert_btn.setText(f"Alerts ({count})")
-            alert_btn.setProperty("alert", True)
-            self.status_bar.showMessage(f"!! {count} new alert(s)")
-        else:
-            alert_btn.setText(self.nav_labels.get("alerts", "Alerts"))
-            alert_btn.setProperty("alert", False)
+        self.alert_badge.setText(str(count))
+        self.alert_badge.setVisible(count > 0)
 
-        alert_btn.style().unpolish(alert_btn)
-        alert_btn.style().polish(alert_btn)
-        alert_btn.update()
+    def _on_new_alert(self, alert):
+        """Slot do sinal new_alert: conta e agenda um unico aviso"""
+        self._new_alert_count += 1
+        self._last_new_alert = alert
+        if not self._coalesce_timer.isActive():
+            self._coalesce_timer.start()
+
+    def _flush_new_alerts(self):
+        """Mostra na barra de status o lote de alertas acumulado"""
+        if self._last_new_alert is None:
+            return
+        self._status_show(
+            f"!! {self._new_alert_count} new alert(s) - latest: {self._last_new_alert.event_type}"
+        )
+        self._last_new_alert = None
 
     def show_login_page(self):
         """Mostra a pagina de login"""
-        self.stacked_widget.setCurrentWidget(self.login_page)
+        self._show_page(self.login_page)
         self.page_title.setText("Login")
         self.user_label.setText("Not logged in")
         self.top_bar.hide()
         self.hide_navigation()
+        self._disconnect_alert_signal()
+        # Outro usuario pode entrar: nenhum conteudo carregado continua valido
+        self.mark_dirty()
+
+    def _connect_alert_signal(self):
+        """Passa a receber a contagem de alertas (apenas com usuario logado)"""
+        # Unique: ciclos de login/logout nunca duplicam o slot
+        # Queued: o slot sempre roda no loop de eventos da UI
+        signals = self.alert_manager.signals
+        signals.unacknowledged_changed.connect(self._set_alert_indicator, _UNIQUE_QUEUED)
+        signals.unacknowledged_changed.connect(self._mark_alert_pages_dirty, _UNIQUE_QUEUED)
+        signals.new_alert.connect(self._on_new_alert, _UNIQUE_QUEUED)
+        self._alert_signal_connected = True
+
+    def _disconnect_alert_signal(self):
+        """Para de receber a contagem de alertas (logout)"""
+        if self._alert_signal_connected:
+            signals = self.alert_manager.signals
+            signals.unacknowledged_changed.disconnect(self._set_alert_indicator)
+            signals.unacknowledged_changed.disconnect(self._mark_alert_pages_dirty)
+            signals.new_alert.disconnect(self._on_new_alert)
+            self._alert_signal_connected = False
+        # Aviso pendente pertence ao usuario que saiu
+        self._coalesce_timer.stop()
+        self._new_alert_count = 0
+        self._last_new_alert = None
+
+    def mark_dirty(self, *page_ids: str):
+        """Forca o refresh das paginas na proxima navegacao (sem argumentos: todas)"""
+        if page_ids:
+            self._clean_pages.difference_update(page_ids)
+        else:
+            self._clean_pages.clear()
+
+    def _mark_alert_pages_dirty(self, _count: int = 0):
+        self.mark_dirty("alerts")
 
     def hide_navigation(self):
         """Esconde os botoes de navegacao"""
@@ -337,10 +472,19 @@ class MainWindow(QMainWindow):
 
     def on_login_success(self):
         """Callback quando login e bem-sucedido"""
-        self.show_navigation()
-        self.navigate_to_page("dashboard")
-        self.status_bar.showMessage(f"Logged in as {self.auth_manager.current_user['username']}")
-        self.user_label.setText(self.auth_manager.current_user['username'])
+        # Varias mudancas de UI em sequencia: um unico repaint ao final
+        self.setUpdatesEnabled(False)
+        try:
+            self.show_navigation()
+            self.navigate_to_page("dashboard")
+            username = self.auth_manager.current_user['username']
+            self._status_show(f"Logged in as {username}")
+            self.user_label.setText(username)
+            # Sincroniza o badge com o estado atual; depois disso so por sinal
+            self._connect_alert_signal()
+            self._set_alert_indicator(self.alert_manager.active_unacknowledged_count)
+        finally:
+            self.setUpdatesEnabled(True)
         user_id = self.auth_manager.get_user_id()
         if user_id:
             self.alert_manager.setup_email_notifier(user_id)
@@ -348,74 +492,73 @@ class MainWindow(QMainWindow):
         if self.app_settings.get("silent_mode", False) and self.app_settings.get("enable_tray", True):
             self.hide()
 
+        # Constroi as demais paginas enquanto o usuario le o dashboard,
+        # uma por volta do loop de eventos para nao travar a UI
+        self._prebuild_queue = [pid for pid in self._NAV_TABLE if pid not in self._pages]
+        QTimer.singleShot(0, self._prebuild_next_page)
+
+    def _prebuild_next_page(self):
+        """Constroi a proxima pagina pendente e agenda a seguinte"""
+        if not self._prebuild_queue or not self.auth_manager.is_logged_in():
+            self._prebuild_queue = []
+            return
+        page_id = self._prebuild_queue.pop(0)
+        try:
+            self.get_page(page_id)
+        except Exception as e:
+            # Falha aqui nao pode interromper as demais; a navegacao tenta de novo
+            logger.error(f"Erro ao pre-construir pagina {page_id}: {e}")
+        if self._prebuild_queue:
+            QTimer.singleShot(0, self._prebuild_next_page)
+
     def navigate_to_page(self, page_id: str):
         """Navega para uma pagina"""
         if page_id == "logout":
             self.auth_manager.logout()
-            self.alert_timer.stop()
             self.engine_manager.stop()
             self.camera_manager.clear_processors()
             self._update_engine_status()
             self.show_login_page()
-            self.hide_navigation()
-            self.status_bar.showMessage("Logged out")
+            self._status_show("Logged out")
             self._set_alert_indicator(0)
             return
 
-        for pid, btn in self.nav_buttons.items():
-            btn.setChecked(pid == page_id)
-
-        if page_id == "dashboard":
-            self.stacked_widget.setCurrentWidget(self.dashboard_page)
-            self.dashboard_page.refresh()
-            self.page_title.setText("Dashboard")
-        elif page_id == "live":
-            self.stacked_widget.setCurrentWidget(self.live_view_page)
-            # Don't call refresh() - it's handled by start_stream()
-            self.page_title.setText("Live View")
-        elif page_id == "cameras":
-            self.stacked_widget.setCurrentWidget(self.cameras_page)
-            self.cameras_page.refresh()
-            self.page_title.setText("Cameras")
-        elif page_id == "zones":
-            self.stacked_widget.setCurrentWidget(self.zones_page)
-            self.zones_page.refresh()
-            self.page_title.setText("Zones")
-        elif page_id == "alerts":
-            self.stacked_widget.setCurrentWidget(self.alerts_page)
-            self.alerts_page.refresh()
-            self.page_title.setText("Alerts")
-        elif page_id == "profile":
-            self.stacked_widget.setCurrentWidget(self.profile_page)
-            self.profile_page.load_profile()
-            self.page_title.setText("Profile")
-        elif page_id == "settings":
-            self.stacked_widget.setCurrentWidget(self.settings_page)
-            self.settings_page.refresh()
-            self.page_title.setText("Settings")
-        elif page_id == "diagnostics":
-            self.stacked_widget.setCurrentWidget(self.diagnostics_page)
-            self.diagnostics_page.refresh_diagnostics()
-            self.page_title.setText("Diagnostics")
-    
+        btn = self.nav_buttons.get(page_id)
+        if btn is not None:
+            btn.setChecked(True)
+
+        entry = self._nav_entries.get(page_id)
+        if entry is None:
+            entry = self._build_nav_entry(page_id)
+            if entry is None:
+                return
+        page, refresh, title = entry
+        if page_id == "alerts":
+            self._new_alert_count = 0
+            self._last_new_alert = None
+        self._show_page(page)
+        if refresh and page_id not in self._clean_pages:
+            refresh()
+            if page_id in self._DIRTY_TRACKED:
+                self._clean_pages.add(page_id)
+        self.page_title.setText(title)
+
+    def _on_cameras_changed(self):
+        """Mantem o filtro de cameras do historico em dia"""
+        alerts_page = self._pages.get("alerts")
+        if alerts_page is not None:
+            alerts_page.refresh_cameras()
+
+    def _on_nav_id_clicked(self, nav_id: int):
+        """Slot unico dos botoes de navegacao"""
+        self.navigate_to_page(self._nav_id_to_page[nav_id])
+
     def navigate_to(self, page_id: str):
         """Alias para navigate_to_page usado pelos menus"""
         self.navigate_to_page(page_id)
 
-        self.status_bar.showMessage(f"Viewing {page_id.capitalize()}")
-
-    def check_alerts(self):
-        """Verifica alertas ativos"""
-        if not self.auth_manager.is_logged_in():
-            return
-
-        alerts = self.alert_manager.get_active_alerts()
-        if alerts:
-            unacknowledged = [a for a in alerts if not a.acknowledged]
-            if unacknowledged:
-                self._set_alert_indicator(len(unacknowledged))
-                return
-        self._set_alert_indicator(0)
+        # Mensagem transitoria: o Qt limpa sozinho apos o timeout
+        self._status_show(f"Viewing {page_id.capitalize()}", 2000)
 
     def closeEvent(self, event):
         """Evento de fechamento da aplicacao - sem confirmação, fecha direto"""
@@ -424,8 +567,17 @@ class MainWindow(QMainWindow):
             event.ignore()
             return
 
+        if self.app_settings.get("silent_mode", False) and self.allow_close:
+            # Watchdog e callbacks ficam na thread da GUI; o join dos
+            # processadores vai para o pool para a janela fechar na hora
+            self.hide()
+            self.engine_manager.stop(stop_processors=False)
+            QThreadPool.globalInstance().start(self.camera_manager.clear_processors)
+            logger.info("Aplicacao fechada")
+            event.accept()
+            return
+
         # Fecha direto sem perguntar
-        self.alert_timer.stop()
         self.engine_manager.stop()
         self.camera_manager.clear_processors()
         logger.info("Aplicacao fechada")
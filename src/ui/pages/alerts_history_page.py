@@ -2,36 +2,247 @@
 Página de histórico de alertas com filtros e exports
 """
 import logging
+import sqlite3
 from datetime import datetime, timedelta
+from functools import lru_cache, partial
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QTableWidget, QTableWidgetItem,
     QPushButton, QDateEdit, QComboBox, QLineEdit, QFileDialog, QMessageBox,
-    QHeaderView, QScrollArea
+    QHeaderView, QScrollArea, QApplication, QStyle, QStyledItemDelegate, QStyleOptionButton,
+    QDialog
 )
-from PySide6.QtCore import Qt, QDate, QTimer
-from PySide6.QtGui import QFont, QColor, QPixmap
+from PySide6.QtCore import (
+    Qt, QDate, QTimer, QObject, QThread, QSignalBlocker, Signal, Slot, QEvent, QRect, QSize,
+    QRunnable, QThreadPool
+)
+from PySide6.QtGui import QFont, QColor, QPixmap, QPixmapCache, QImage, QImageReader
 from pathlib import Path
 
 from config.ui_theme import color_for_status, contrast_text
 
 logger = logging.getLogger(__name__)
 
+# Linhas por página da tabela
+PAGE_SIZE = 50
+
+# Tamanho máximo da pré-visualização de snapshots
+SNAPSHOT_PREVIEW_SIZE = QSize(640, 360)
+
+# Colunas exibidas pela tabela (evita trazer metadata/evidence_frames)
+_ROW_COLUMNS = (
+    "id, timestamp, camera_id, zone_id AS zone, event_type, confidence, is_real, snapshot_path"
+)
+
+# Consultas da página; {clause} recebe os filtros ativos
+_SQL_TEMPLATES = {
+    "count": "SELECT COUNT(*) FROM events WHERE 1=1{clause}",
+    "page": (f"SELECT {_ROW_COLUMNS} FROM events WHERE 1=1{{clause}}"
+             " ORDER BY timestamp DESC, id DESC LIMIT ? OFFSET ?"),
+    "incremental": (f"SELECT {_ROW_COLUMNS} FROM events WHERE id > ?{{clause}}"
+                    " ORDER BY id DESC LIMIT ?"),
+}
+
+
+def _status_style(status_text: str):
+    status_hex = color_for_status(status_text)
+    return status_text, QColor(status_hex), QColor(contrast_text(status_hex))
+
+
+# is_real -> (texto, fundo, texto do status), criados uma vez
+_STATUS_STYLES = {
+    None: _status_style("Unreviewed"),
+    1: _status_style("Real"),
+    0: _status_style("False Positive"),
+}
+
+
+@lru_cache(maxsize=1024)
+def _fmt_conf(basis_points: int) -> str:
+    """Formata a confiança (em centésimos de ponto percentual)"""
+    return f"{basis_points / 10000:.2%}"
+
+
+class AlertsFetcher(QObject):
+    """Executa as consultas da página numa thread própria"""
+
+    # (geração, modo, linhas); modo "error" sinaliza falha na consulta
+    results_ready = Signal(int, str, list)
+
+    def __init__(self, db_path):
+        super().__init__()
+        self._db_path = db_path
+        self._conn = None
+
+    @Slot(int, str, str, list)
+    def fetch(self, generation: int, mode: str, query: str, params: list):
+        """Executa a consulta e devolve as linhas para a GUI"""
+        try:
+            # Conexão própria: sqlite3 não compartilha conexão entre threads
+            if self._conn is None:
+                self._conn = sqlite3.connect(str(self._db_path), cached_statements=256)
+                self._conn.row_factory = sqlite3.Row
+            rows = self._conn.execute(query, params).fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"Erro ao buscar alertas: {e}")
+            self.results_ready.emit(generation, "error", [])
+            return
+        self.results_ready.emit(generation, mode, rows)
+
+    @Slot()
+    def close(self):
+        """Fecha a conexão na thread do worker"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+class _SnapshotSignals(QObject):
+    """Entrega à GUI a imagem decodificada no pool"""
+    loaded = Signal(str, QImage)
+
+
+class _SnapshotLoader(QRunnable):
+    """Decodifica o snapshot já reduzido, fora da thread da GUI"""
+
+    def __init__(self, path: str, signals: _SnapshotSignals):
+        super().__init__()
+        self._path = path
+        self._signals = signals
+
+    def run(self):
+        reader = QImageReader(self._path)
+        size = reader.size()
+        if size.isValid():
+            # Reduz na decodificação (JPEG decodifica direto em escala menor)
+            reader.setScaledSize(size.scaled(SNAPSHOT_PREVIEW_SIZE, Qt.AspectRatioMode.KeepAspectRatio))
+        self._signals.loaded.emit(self._path, reader.read())
+
+
+class ActionsDelegate(QStyledItemDelegate):
+    """Desenha botões na célula e trata o clique, sem widgets por linha"""
+
+    # (linha, índice do botão clicado)
+    clicked = Signal(int, int)
+
+    _PADDING = 4
+
+    def _labels(self, index):
+        return index.data(Qt.UserRole) or ()
+
+    def _button_rects(self, option, labels):
+        metrics = option.fontMetrics
+        pad = self._PADDING
+        rects = []
+        x = option.rect.left() + pad
+        for label in labels:
+            width = metrics.horizontalAdvance(label) + 4 * pad
+            rects.append(QRect(x, option.rect.top() + pad, width, option.rect.height() - 2 * pad))
+            x += width + pad
+        return rects
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+        labels = self._labels(index)
+        if not labels:
+            return
+
+        style = option.widget.style() if option.widget else QApplication.style()
+        for label, rect in zip(labels, self._button_rects(option, labels)):
+            button = QStyleOptionButton()
+            button.rect = rect
+            button.text = label
+            button.state = QStyle.StateFlag.State_Enabled | QStyle.StateFlag.State_Raised
+            style.drawControl(QStyle.ControlElement.CE_PushButton, button, painter, option.widget)
+
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.Type.MouseButtonRelease
+                and event.button() == Qt.MouseButton.LeftButton):
+            labels = self._labels(index)
+            pos = event.position().toPoint()
+            for i, rect in enumerate(self._button_rects(option, labels)):
+                if rect.contains(pos):
+                    self.clicked.emit(index.row(), i)
+                    return True
+        return super().editorEvent(event, model, option, index)
+
+    def sizeHint(self, option, index):
+        hint = super().sizeHint(option, index)
+        labels = self._labels(index)
+        if not labels:
+            return hint
+        rects = self._button_rects(option, labels)
+        width = rects[-1].right() - option.rect.left() + self._PADDING
+        return QSize(max(hint.width(), width), max(hint.height(), option.fontMetrics.height() + 4 * self._PADDING))
+
 
 class AlertsHistoryPage(QWidget):
     """Página de histórico de alertas"""
 
+    _fetch_requested = Signal(int, str, str, list)
+
     def __init__(self, db_manager, camera_manager=None):
         super().__init__()
         self.db_manager = db_manager
         self.camera_manager = camera_manager
 
+        # Consultas rodam no worker; a GUI só preenche a tabela
+        self._generation = 0
+        self._in_flight = False
+        self._thread = QThread(self)
+        self._fetcher = AlertsFetcher(db_manager.db_path)
+        self._fetcher.moveToThread(self._thread)
+        self._fetch_requested.connect(self._fetcher.fetch)
+        self._fetcher.results_ready.connect(self._on_results_ready)
+        self._thread.finished.connect(self._fetcher.close)
+        self._thread.start()
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.stop_fetcher)
+
+        # Maior id já exibido; o timer só busca eventos mais novos que ele
+        self._last_seen_id = 0
+        self._filters_dirty = True
+        self._filter_clause = ""
+        self._filter_params = []
+        # SQL já montado por (tipo de consulta, cláusula de filtros)
+        self._stmt_cache = {}
+
+        # Paginação no banco: só a página visível é buscada
+        self._page = 0
+        self._page_size = PAGE_SIZE
+        self._total = 0
+        # Linhas exibidas na página atual
+        self._rows = []
+
+        # Marcações agrupadas: vários cliques viram um UPDATE por status
+        self._pending_real = set()
+        self._pending_fp = set()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(300)
+        self._flush_timer.timeout.connect(self._flush_marks)
+
+        # Snapshots: decodificados no pool e guardados no QPixmapCache
+        QPixmapCache.setCacheLimit(64 * 1024)  # KB
+        self._snapshot_loading = set()
+        self._snapshot_signals = _SnapshotSignals(self)
+        self._snapshot_signals.loaded.connect(self._on_snapshot_loaded)
+
+        # Debounce dos filtros: só o estado final da interação consulta
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(150)
+        self._reload_timer.timeout.connect(self._full_reload)
+
         self.setup_ui()
-        self.load_alerts()
+        self._camera_ids = []
+        self._load_cameras()
 
-        # Timer para atualização automática
+        # Timer para atualização automática (apenas linhas novas); só
+        # roda com a página visível, ver showEvent/hideEvent
         self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.load_alerts)
-        self.update_timer.start(10000)  # Atualizar a cada 10 segundos
+        self.update_timer.setTimerType(Qt.TimerType.VeryCoarseTimer)  # permite agrupar wakeups
+        self.update_timer.timeout.connect(self._incremental_refresh)
 
     def setup_ui(self):
         """Configura a interface"""
@@ -52,14 +263,14 @@ class AlertsHistoryPage(QWidget):
         filter_layout.addWidget(QLabel("From:"))
         self.date_from = QDateEdit()
         self.date_from.setDate(QDate.currentDate().addDays(-7))
-        self.date_from.dateChanged.connect(self.load_alerts)
+        self.date_from.dateChanged.connect(self._on_filters_changed)
         filter_layout.addWidget(self.date_from)
 
         # Data final
         filter_layout.addWidget(QLabel("To:"))
         self.date_to = QDateEdit()
         self.date_to.setDate(QDate.currentDate())
-        self.date_to.dateChanged.connect(self.load_alerts)
+        self.date_to.dateChanged.connect(self._on_filters_changed)
         filter_layout.addWidget(self.date_to)
 
         # Tipo de evento
@@ -69,21 +280,21 @@ class AlertsHistoryPage(QWidget):
             "All", "intrusion", "loitering", "theft", "crowd_anomaly",
             "fire_smoke", "vandalism"
         ])
-        self.event_type_filter.currentTextChanged.connect(self.load_alerts)
+        self.event_type_filter.currentTextChanged.connect(self._on_filters_changed)
         filter_layout.addWidget(self.event_type_filter)
 
         # Câmera
         filter_layout.addWidget(QLabel("Camera:"))
         self.camera_filter = QComboBox()
         self.camera_filter.addItem("All")
-        self.camera_filter.currentTextChanged.connect(self.load_alerts)
+        self.camera_filter.currentTextChanged.connect(self._on_filters_changed)
         filter_layout.addWidget(self.camera_filter)
 
         # Status
         filter_layout.addWidget(QLabel("Status:"))
         self.status_filter = QComboBox()
         self.status_filter.addItems(["All", "Real", "False Positive", "Unreviewed"])
-        self.status_filter.currentTextChanged.connect(self.load_alerts)
+        self.status_filter.currentTextChanged.connect(self._on_filters_changed)
         filter_layout.addWidget(self.status_filter)
 
         filter_layout.addStretch()
@@ -92,6 +303,8 @@ class AlertsHistoryPage(QWidget):
         # Tabela de alertas
         self.alerts_table = QTableWidget()
         self.alerts_table.setColumnCount(8)
+        self.alerts_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.alerts_table.setSelectionMode(QTableWidget.SelectionMode.ExtendedSelection)
         self.alerts_table.setHorizontalHeaderLabels([
             "Timestamp", "Camera", "Zone", "Event Type", "Confidence",
             "Status", "Snapshot", "Actions"
@@ -108,6 +321,7 @@ class AlertsHistoryPage(QWidget):
         header.setSectionResizeMode(6, QHeaderView.ResizeToContents)
         header.setSectionResizeMode(7, QHeaderView.ResizeToContents)
 
+        self._create_row_pool()
         main_layout.addWidget(self.alerts_table)
 
         # Botões de ação
@@ -125,128 +339,334 @@ class AlertsHistoryPage(QWidget):
         refresh_btn.clicked.connect(self.load_alerts)
         action_layout.addWidget(refresh_btn)
 
+        mark_real_btn = QPushButton("Mark Selected Real")
+        mark_real_btn.setObjectName("SuccessButton")
+        mark_real_btn.clicked.connect(partial(self._mark_selected, True))
+        action_layout.addWidget(mark_real_btn)
+
+        mark_fp_btn = QPushButton("Mark Selected FP")
+        mark_fp_btn.setObjectName("DangerButton")
+        mark_fp_btn.clicked.connect(partial(self._mark_selected, False))
+        action_layout.addWidget(mark_fp_btn)
+
         action_layout.addStretch()
+
+        self.prev_btn = QPushButton("Prev")
+        self.prev_btn.clicked.connect(self._go_prev)
+        action_layout.addWidget(self.prev_btn)
+
+        self.page_label = QLabel("Page 1 of 1")
+        action_layout.addWidget(self.page_label)
+
+        self.next_btn = QPushButton("Next")
+        self.next_btn.clicked.connect(self._go_next)
+        action_layout.addWidget(self.next_btn)
+
         main_layout.addLayout(action_layout)
 
         self.setLayout(main_layout)
 
+    def _on_filters_changed(self):
+        """Filtros mudaram: agenda recarga completa"""
+        self._filters_dirty = True
+        self._reload_timer.start()
+
     def load_alerts(self):
         """Carrega alertas com filtros"""
+        self._full_reload()
+
+    def _rebuild_filter_clause(self):
+        """Monta a cláusula WHERE dos filtros uma vez por mudança de filtro"""
+        clause = ""
+        params = []
+
+        # Filtro de data
+        date_from = self.date_from.date().toPython()
+        date_to = self.date_to.date().toPython()
+
+        clause += " AND timestamp >= ? AND timestamp < ?"
+        params.extend([
+            date_from.isoformat(),
+            (date_to + timedelta(days=1)).isoformat()
+        ])
+
+        # Filtro de tipo de evento
+        event_type = self.event_type_filter.currentText()
+        if event_type != "All":
+            clause += " AND event_type = ?"
+            params.append(event_type)
+
+        # Filtro de câmera
+        camera_id = self.camera_filter.currentData()
+        if camera_id is not None:
+            clause += " AND camera_id = ?"
+            params.append(camera_id)
+
+        # Filtro de status
+        status = self.status_filter.currentText()
+        if status == "Real":
+            clause += " AND is_real = 1"
+        elif status == "False Positive":
+            clause += " AND is_real = 0"
+        elif status == "Unreviewed":
+            clause += " AND is_real IS NULL"
+
+        self._filter_clause = clause
+        self._filter_params = params
+        self._filters_dirty = False
+
+    def _load_cameras(self):
+        """Preenche o filtro de câmeras; fora do caminho do timer"""
         try:
-            # Construir query com filtros
-            query = "SELECT * FROM events WHERE 1=1"
-            params = []
-
-            # Filtro de data
-            date_from = self.date_from.date().toPython()
-            date_to = self.date_to.date().toPython()
-
-            query += " AND timestamp >= ? AND timestamp < ?"
-            params.extend([
-                date_from.isoformat(),
-                (date_to + timedelta(days=1)).isoformat()
-            ])
+            cameras = self.db_manager.execute_query("SELECT id, name FROM cameras ORDER BY name")
+        except Exception as e:
+            logger.error(f"Erro ao carregar câmeras: {e}")
+            return
 
-            # Filtro de tipo de evento
-            event_type = self.event_type_filter.currentText()
-            if event_type != "All":
-                query += " AND event_type = ?"
-                params.append(event_type)
-
-            # Filtro de câmera
-            camera = self.camera_filter.currentText()
-            if camera != "All":
-                query += " AND camera_id = ?"
-                params.append(camera)
-
-            # Filtro de status
-            status = self.status_filter.currentText()
-            if status == "Real":
-                query += " AND is_real = 1"
-            elif status == "False Positive":
-                query += " AND is_real = 0"
-            elif status == "Unreviewed":
-                query += " AND is_real IS NULL"
-
-            query += " ORDER BY timestamp DESC LIMIT 1000"
-
-            results = self.db_manager.execute_query(query, params)
-
-            # Atualizar tabela
-            self.alerts_table.setRowCount(len(results) if results else 0)
-
-            if results:
-                for row, alert in enumerate(results):
-                    # Timestamp
-                    timestamp_item = QTableWidgetItem(str(alert[1]))
-                    self.alerts_table.setItem(row, 0, timestamp_item)
-
-                    # Câmera
-                    camera_item = QTableWidgetItem(str(alert[2]))
-                    self.alerts_table.setItem(row, 1, camera_item)
-
-                    # Zona
-                    zone_item = QTableWidgetItem(str(alert[3] or "-"))
-                    self.alerts_table.setItem(row, 2, zone_item)
-
-                    # Tipo de evento
-                    event_type_item = QTableWidgetItem(str(alert[4]))
-                    self.alerts_table.setItem(row, 3, event_type_item)
-
-                    # Confiança
-                    confidence = alert[5]
-                    confidence_item = QTableWidgetItem(f"{confidence:.2%}" if confidence else "-")
-                    self.alerts_table.setItem(row, 4, confidence_item)
-
-                    # Status
-                    is_real = alert[6]
-                    if is_real is None:
-                        status_text = "Unreviewed"
-                    elif is_real:
-                        status_text = "Real"
-                    else:
-                        status_text = "False Positive"
-
-                    status_item = QTableWidgetItem(status_text)
-                    status_hex = color_for_status(status_text)
-                    status_item.setBackground(QColor(status_hex))
-                    status_item.setForeground(QColor(contrast_text(status_hex)))
-                    self.alerts_table.setItem(row, 5, status_item)
-
-                    # Snapshot
-                    snapshot_btn = QPushButton("View")
-                    snapshot_btn.setObjectName("GhostButton")
-                    snapshot_path = alert[7]
-                    snapshot_btn.clicked.connect(
-                        lambda checked, path=snapshot_path: self.view_snapshot(path)
-                    )
-                    self.alerts_table.setCellWidget(row, 6, snapshot_btn)
-
-                    # Ações
-                    actions_layout = QHBoxLayout()
-
-                    if is_real is None:
-                        real_btn = QPushButton("Real")
-                        real_btn.setObjectName("SuccessButton")
-                        real_btn.clicked.connect(
-                            lambda checked, alert_id=alert[0]: self.mark_real(alert_id)
-                        )
-                        actions_layout.addWidget(real_btn)
-
-                        fp_btn = QPushButton("FP")
-                        fp_btn.setObjectName("DangerButton")
-                        fp_btn.clicked.connect(
-                            lambda checked, alert_id=alert[0]: self.mark_false_positive(alert_id)
-                        )
-                        actions_layout.addWidget(fp_btn)
-
-                    actions_widget = QWidget()
-                    actions_widget.setLayout(actions_layout)
-                    self.alerts_table.setCellWidget(row, 7, actions_widget)
+        selected = self.camera_filter.currentData()
+        self._camera_ids = [camera[0] for camera in cameras]
+
+        # Repopular não deve disparar recarga da tabela
+        blocker = QSignalBlocker(self.camera_filter)
+        self.camera_filter.clear()
+        self.camera_filter.addItem("All")
+        for camera_id, name in cameras:
+            self.camera_filter.addItem(name, camera_id)
+        index = self.camera_filter.findData(selected) if selected is not None else 0
+        self.camera_filter.setCurrentIndex(max(index, 0))
+        blocker.unblock()
+
+        # Câmera selecionada foi removida: volta para "All" e recarrega
+        if selected is not None and index < 0:
+            self._on_filters_changed()
+
+    def refresh_cameras(self):
+        """Recarrega a lista de câmeras (câmera adicionada ou removida)"""
+        self._load_cameras()
+
+    def _request_fetch(self, mode: str, query: str, params: list):
+        """Envia a consulta para o worker"""
+        if mode != "count":
+            self._in_flight = True
+        self._fetch_requested.emit(self._generation, mode, query, params)
+
+    def _full_reload(self):
+        """Recarrega a tabela inteira com os filtros atuais"""
+        try:
+            if self._filters_dirty:
+                self._rebuild_filter_clause()
+                self._page = 0
+                self._last_seen_id = 0
+
+            # Nova geração: respostas de consultas anteriores são descartadas
+            self._generation += 1
+            self._request_fetch("count", self._sql("count"), list(self._filter_params))
+            self._load_page()
 
         except Exception as e:
             logger.error(f"Erro ao carregar alertas: {e}")
 
+    def _sql(self, kind: str) -> str:
+        """SQL da consulta para os filtros atuais, montado uma vez por combinação"""
+        key = (kind, self._filter_clause)
+        sql = self._stmt_cache.get(key)
+        if sql is None:
+            sql = _SQL_TEMPLATES[kind].format(clause=self._filter_clause)
+            self._stmt_cache[key] = sql
+        return sql
+
+    def _build_query(self, select_cols: str):
+        """Monta a consulta filtrada, sem paginação"""
+        if self._filters_dirty:
+            self._rebuild_filter_clause()
+
+        query = (f"SELECT {select_cols} FROM events WHERE 1=1{self._filter_clause}"
+                 " ORDER BY timestamp DESC, id DESC")
+        return query, list(self._filter_params)
+
+    def _load_page(self):
+        """Busca a página atual"""
+        params = self._filter_params + [self._page_size, self._page * self._page_size]
+        self._request_fetch("full", self._sql("page"), params)
+
+    def _go_prev(self):
+        """Página anterior"""
+        if self._page > 0:
+            self._page -= 1
+            self._generation += 1
+            self._load_page()
+            self._update_page_controls()
+
+    def _go_next(self):
+        """Próxima página"""
+        if self._page + 1 < self._page_count():
+            self._page += 1
+            self._generation += 1
+            self._load_page()
+            self._update_page_controls()
+
+    def _page_count(self) -> int:
+        return max(1, -(-self._total // self._page_size))
+
+    def _update_page_controls(self):
+        """Atualiza o rótulo "page X of Y" e os botões"""
+        pages = self._page_count()
+        self.page_label.setText(f"Page {self._page + 1} of {pages}")
+        self.prev_btn.setEnabled(self._page > 0)
+        self.next_btn.setEnabled(self._page + 1 < pages)
+
+    def _incremental_refresh(self):
+        """Busca só os eventos com id maior que o último exibido"""
+        if self._filters_dirty:
+            self._full_reload()
+            return
+        if self._in_flight:
+            return
+
+        params = [self._last_seen_id] + self._filter_params + [self._page_size]
+        self._request_fetch("incremental", self._sql("incremental"), params)
+
+    @Slot(int, str, list)
+    def _on_results_ready(self, generation: int, mode: str, results: list):
+        """Recebe as linhas do worker"""
+        if generation != self._generation:
+            return
+
+        try:
+            if mode == "count":
+                self._total = results[0][0] if results else 0
+                self._update_page_controls()
+                return
+
+            self._in_flight = False
+            if mode == "full":
+                self._populate_table(results)
+            elif mode == "incremental":
+                self._prepend_rows(results)
+        except Exception as e:
+            logger.error(f"Erro ao atualizar alertas: {e}")
+
+    def _populate_table(self, results: list):
+        """Substitui o conteúdo da tabela"""
+        self._bind_rows(results)
+
+        self._last_seen_id = max(
+            self._last_seen_id, max((alert["id"] for alert in results), default=0)
+        )
+
+    def _prepend_rows(self, results: list):
+        """Insere eventos novos no topo da primeira página"""
+        if not results:
+            return
+        if len(results) >= self._page_size:
+            # Chegou mais que uma página: recarrega e reconta
+            self._full_reload()
+            return
+
+        self._last_seen_id = results[0]["id"]
+        self._total += len(results)
+        self._update_page_controls()
+
+        # Nas outras páginas o conteúdo só se desloca; não mexe na tabela
+        if self._page != 0:
+            return
+
+        self._bind_rows((list(results) + self._rows)[:self._page_size])
+
+    def _create_row_pool(self):
+        """Cria uma vez os itens de todas as linhas da página"""
+        table = self.alerts_table
+        table.setRowCount(self._page_size)
+
+        for row in range(self._page_size):
+            for col in range(6):
+                table.setItem(row, col, QTableWidgetItem())
+
+            # Snapshot e Ações são desenhados pelos delegates
+            for col in (6, 7):
+                item = QTableWidgetItem()
+                item.setFlags(Qt.ItemFlag.ItemIsEnabled)
+                table.setItem(row, col, item)
+
+            table.setRowHidden(row, True)
+
+        self._view_delegate = ActionsDelegate(table)
+        self._view_delegate.clicked.connect(self._on_view_clicked)
+        table.setItemDelegateForColumn(6, self._view_delegate)
+
+        self._actions_delegate = ActionsDelegate(table)
+        self._actions_delegate.clicked.connect(self._on_action_clicked)
+        table.setItemDelegateForColumn(7, self._actions_delegate)
+
+    def _bind_rows(self, results: list):
+        """Atualiza os itens existentes com os eventos e esconde o que sobra"""
+        self._rows = list(results)
+        table = self.alerts_table
+
+        # Atualização em lote: sem ordenação, repaint ou sinais por célula
+        sorting = table.isSortingEnabled()
+        table.setSortingEnabled(False)
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        try:
+            for row in range(self._page_size):
+                hidden = row >= len(self._rows)
+                table.setRowHidden(row, hidden)
+                if not hidden:
+                    self._fill_row(row, self._rows[row])
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+            table.setSortingEnabled(sorting)
+
+    def _fill_row(self, row: int, alert):
+        """Preenche uma linha da tabela com um evento"""
+        table = self.alerts_table
+
+        # Timestamp; o id fica no item para identificar a linha
+        timestamp_item = table.item(row, 0)
+        timestamp_item.setText(str(alert["timestamp"]))
+        timestamp_item.setData(Qt.UserRole, alert["id"])
+
+        # Snapshot
+        table.item(row, 6).setData(Qt.UserRole, ("View",))
+
+        # Câmera
+        table.item(row, 1).setText(str(alert["camera_id"]))
+
+        # Zona
+        table.item(row, 2).setText(str(alert["zone"] or "-"))
+
+        # Tipo de evento
+        table.item(row, 3).setText(str(alert["event_type"]))
+
+        # Confiança
+        confidence = alert["confidence"]
+        table.item(row, 4).setText(_fmt_conf(round(confidence * 10000)) if confidence else "-")
+
+        # Status
+        is_real = alert["is_real"]
+        status_text, background, foreground = _STATUS_STYLES[
+            None if is_real is None else int(bool(is_real))
+        ]
+        status_item = table.item(row, 5)
+        status_item.setText(status_text)
+        status_item.setBackground(background)
+        status_item.setForeground(foreground)
+
+        # Ações só para alertas ainda não revisados
+        table.item(row, 7).setData(Qt.UserRole, ("Real", "FP") if is_real is None else ())
+
+    def _on_view_clicked(self, row: int, button: int):
+        self.view_snapshot(self._rows[row]["snapshot_path"])
+
+    def _on_action_clicked(self, row: int, button: int):
+        alert_id = self._rows[row]["id"]
+        if button == 0:
+            self.mark_real(alert_id)
+        else:
+            self.mark_false_positive(alert_id)
+
     def view_snapshot(self, snapshot_path: str):
         """Visualiza snapshot"""
         try:
@@ -254,35 +674,128 @@ class AlertsHistoryPage(QWidget):
                 QMessageBox.warning(self, "Error", "Snapshot not found")
                 return
 
-            # Aqui você implementaria visualização de imagem
-            logger.info(f"Visualizando snapshot: {snapshot_path}")
+            pixmap = QPixmapCache.find(snapshot_path)
+            if pixmap is not None:
+                self._show_snapshot(snapshot_path, pixmap)
+                return
+
+            if snapshot_path not in self._snapshot_loading:
+                self._snapshot_loading.add(snapshot_path)
+                QThreadPool.globalInstance().start(
+                    _SnapshotLoader(snapshot_path, self._snapshot_signals)
+                )
 
         except Exception as e:
             logger.error(f"Erro ao visualizar snapshot: {e}")
 
+    @Slot(str, QImage)
+    def _on_snapshot_loaded(self, snapshot_path: str, image: QImage):
+        """Converte, guarda no cache e exibe o snapshot carregado"""
+        self._snapshot_loading.discard(snapshot_path)
+        if image.isNull():
+            QMessageBox.warning(self, "Error", "Could not read snapshot")
+            return
+
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(snapshot_path, pixmap)
+        self._show_snapshot(snapshot_path, pixmap)
+
+    def _show_snapshot(self, snapshot_path: str, pixmap: QPixmap):
+        """Abre o snapshot numa janela"""
+        logger.info(f"Visualizando snapshot: {snapshot_path}")
+
+        dialog = QDialog(self)
+        dialog.setWindowTitle(Path(snapshot_path).name)
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        layout = QVBoxLayout(dialog)
+        label = QLabel()
+        label.setPixmap(pixmap)
+        layout.addWidget(label)
+        dialog.show()
+
     def mark_real(self, alert_id: int):
         """Marca alerta como real"""
-        try:
-            query = "UPDATE events SET is_real = 1 WHERE id = ?"
-            self.db_manager.execute_update(query, (alert_id,))
-
-            self.load_alerts()
-            QMessageBox.information(self, "Success", "Alert marked as real")
-
-        except Exception as e:
-            logger.error(f"Erro ao marcar alerta: {e}")
+        self._queue_mark(alert_id, True)
 
     def mark_false_positive(self, alert_id: int):
         """Marca alerta como falso positivo"""
+        self._queue_mark(alert_id, False)
+
+    def _queue_mark(self, alert_id: int, is_real: bool):
+        """Aplica a marcação na tela e agenda a gravação"""
+        if is_real:
+            self._pending_real.add(alert_id)
+            self._pending_fp.discard(alert_id)
+        else:
+            self._pending_fp.add(alert_id)
+            self._pending_real.discard(alert_id)
+        self._patch_row_status(alert_id, int(is_real))
+        self._flush_timer.start()
+
+    def _patch_row_status(self, alert_id: int, is_real: int):
+        """Atualiza o status de uma linha visível sem consultar o banco"""
+        for row, alert in enumerate(self._rows):
+            if alert["id"] == alert_id:
+                alert = dict(alert)
+                alert["is_real"] = is_real
+                self._rows[row] = alert
+                self._fill_row(row, alert)
+                break
+
+    def _flush_marks(self):
+        """Grava as marcações pendentes e atualiza a tabela uma vez"""
         try:
-            query = "UPDATE events SET is_real = 0 WHERE id = ?"
-            self.db_manager.execute_update(query, (alert_id,))
-
-            self.load_alerts()
-            QMessageBox.information(self, "Success", "Alert marked as false positive")
-
+            for is_real, ids in ((1, self._pending_real), (0, self._pending_fp)):
+                if ids:
+                    placeholders = ", ".join("?" * len(ids))
+                    query = f"UPDATE events SET is_real = {is_real} WHERE id IN ({placeholders})"
+                    self.db_manager.execute_update(query, tuple(ids))
         except Exception as e:
             logger.error(f"Erro ao marcar alerta: {e}")
+        finally:
+            self._pending_real.clear()
+            self._pending_fp.clear()
+
+        # Com filtro de status as linhas marcadas podem sair da página
+        if self.status_filter.currentText() != "All":
+            self._full_reload()
+        else:
+            self._incremental_refresh()
+
+    def _mark_selected(self, is_real: bool, checked: bool = False):
+        """Marca as linhas selecionadas"""
+        rows = self.alerts_table.selectionModel().selectedRows()
+        self.mark_bulk(
+            [self._rows[index.row()]["id"] for index in rows if index.row() < len(self._rows)],
+            is_real
+        )
+
+    def mark_bulk(self, ids, is_real: bool):
+        """Marca vários alertas numa única transação"""
+        ids = list(ids)
+        if not ids:
+            return
+
+        value = int(is_real)
+        try:
+            self.db_manager.execute_many(
+                "UPDATE events SET is_real = ? WHERE id = ?",
+                [(value, alert_id) for alert_id in ids]
+            )
+        except Exception as e:
+            logger.error(f"Erro ao marcar alertas: {e}")
+            return
+
+        # Já gravados: não deixa uma marcação pendente sobrescrever
+        self._pending_real.difference_update(ids)
+        self._pending_fp.difference_update(ids)
+
+        # Com filtro de status as linhas marcadas podem sair da página
+        if self.status_filter.currentText() != "All":
+            self._full_reload()
+        else:
+            for alert_id in ids:
+                self._patch_row_status(alert_id, value)
 
     def export_csv(self):
         """Exporta alertas para CSV"""
@@ -297,25 +810,7 @@ class AlertsHistoryPage(QWidget):
             if not file_path:
                 return
 
-            import csv
-
-            # Obter dados da tabela
-            with open(file_path, 'w', newline='') as f:
-                writer = csv.writer(f)
-
-                # Header
-                headers = []
-                for col in range(self.alerts_table.columnCount() - 1):  # Excluir Actions
-                    headers.append(self.alerts_table.horizontalHeaderItem(col).text())
-                writer.writerow(headers)
-
-                # Dados
-                for row in range(self.alerts_table.rowCount()):
-                    row_data = []
-                    for col in range(self.alerts_table.columnCount() - 1):
-                        item = self.alerts_table.item(row, col)
-                        row_data.append(item.text() if item else "")
-                    writer.writerow(row_data)
+            self._write_csv(file_path)
 
             QMessageBox.information(self, "Success", f"Exported to {file_path}")
 
@@ -323,6 +818,38 @@ class AlertsHistoryPage(QWidget):
             logger.error(f"Erro ao exportar CSV: {e}")
             QMessageBox.critical(self, "Error", f"Failed to export: {e}")
 
+    def _write_csv(self, file_path: str):
+        """Grava no CSV todos os eventos dos filtros, direto do banco"""
+        import csv
+
+        query, params = self._build_query(
+            "timestamp, camera_id, zone_id, event_type, confidence, is_real, snapshot_path"
+        )
+        with open(file_path, 'w', newline='', buffering=1 << 20) as f:
+            writer = csv.writer(f)
+
+            # Header (sem a coluna Actions)
+            writer.writerow([
+                self.alerts_table.horizontalHeaderItem(col).text()
+                for col in range(self.alerts_table.columnCount() - 1)
+            ])
+
+            # Dados, em blocos para não carregar o resultado inteiro
+            for chunk in self.db_manager.execute_query_iter(query, tuple(params)):
+                writer.writerows(
+                    (
+                        timestamp,
+                        camera_id,
+                        zone_id or "-",
+                        event_type,
+                        _fmt_conf(round(confidence * 10000)) if confidence else "-",
+                        _STATUS_STYLES[None if is_real is None else int(bool(is_real))][0],
+                        snapshot_path or "",
+                    )
+                    for (timestamp, camera_id, zone_id, event_type,
+                         confidence, is_real, snapshot_path) in chunk
+                )
+
     def export_pdf(self):
         """Exporta alertas para PDF"""
         try:
@@ -344,7 +871,31 @@ class AlertsHistoryPage(QWidget):
             logger.error(f"Erro ao exportar PDF: {e}")
             QMessageBox.critical(self, "Error", f"Failed to export: {e}")
 
+    def showEvent(self, event):
+        """Retoma a atualização ao ficar visível"""
+        self.update_timer.start(10000)  # Atualizar a cada 10 segundos
+        # Adiado para depois da navegação: se ela pedir load_alerts, a recarga
+        # completa já está em andamento e o incremental não faz nada
+        QTimer.singleShot(0, self._incremental_refresh)
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        """Pausa a atualização enquanto a página está oculta"""
+        self.update_timer.stop()
+        super().hideEvent(event)
+
+    def stop_fetcher(self):
+        """Encerra a thread de consultas"""
+        # Marcações ainda na janela de agrupamento não podem se perder
+        if self._flush_timer.isActive():
+            self._flush_timer.stop()
+            self._flush_marks()
+        if self._thread.isRunning():
+            self._thread.quit()
+            self._thread.wait()
+
     def closeEvent(self, event):
         """Limpar timer ao fechar"""
         self.update_timer.stop()
+        self.stop_fetcher()
         event.accept()
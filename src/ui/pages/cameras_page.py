@@ -2,6 +2,13 @@
 UI pages for cameras, zones, and settings.
 """
 import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QSpinBox,
@@ -9,21 +16,293 @@ from PySide6.QtWidgets import (
     QTextEdit, QTabWidget, QCheckBox, QFileDialog, QApplication, QDialog
 )
 from PySide6.QtGui import QFont, QColor, QImage, QPixmap
-from PySide6.QtCore import QTimer, QThread, Signal, Qt
-import cv2
-import numpy as np
+from PySide6.QtCore import (
+    QTimer, QThread, Signal, Qt, QMutex, QWaitCondition, QObject, QRunnable, QThreadPool
+)
 
 from pathlib import Path
 
-from config.config import APP_DATA_DIR
+from config.config import APP_DATA_DIR, MODELS_DIR, YOLO_MODEL
 from config.ui_theme import color_for_severity, color_for_status, contrast_text
 
+# cv2/numpy só são importados quando a visualização ao vivo ou o teste de conexão são usados
+if TYPE_CHECKING:
+    import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
+def _cuda_available() -> bool:
+    try:
+        import torch
+    except ImportError:
+        return False
+    return torch.cuda.is_available()
+
+
+# Classes que geram alerta na visualização ao vivo
+SUSPICIOUS_CLASSES = frozenset({"person", "knife", "scissors", "backpack", "handbag", "suitcase"})
+
+# Resolução de entrada do detector (mesma do export TensorRT/OpenVINO)
+DETECT_IMGSZ = 640
+
+
+def _export_once(target: Path, **export_kwargs) -> bool:
+    """Exporta o YOLO para target uma única vez; uma falha fica marcada em disco
+
+    Sem a marca, toda inicialização tentaria de novo um export que leva minutos.
+    Apague o arquivo .failed para tentar outra vez.
+    """
+    if target.exists():
+        return True
+    marker = target.with_name(target.name + ".failed")
+    if marker.exists():
+        return False
+
+    from ultralytics import YOLO
+
+    try:
+        logger.info(f"Exporting YOLO to {target.name} (one-time)...")
+        exported = YOLO(YOLO_MODEL).export(**export_kwargs)
+        Path(exported).replace(target)
+        return True
+    except Exception as e:
+        logger.warning(f"YOLO export to {target.name} failed, not retrying until {marker} is removed: {e}")
+        try:
+            marker.write_text(str(e))
+        except OSError as write_error:
+            logger.error(f"Erro ao gravar {marker}: {write_error}")
+        return False
+
+
+def _load_yolo_model():
+    """Carrega o YOLO: TensorRT FP16 com CUDA, OpenVINO INT8 na CPU (exportados uma vez)"""
+    from ultralytics import YOLO
+
+    if _cuda_available():
+        engine_path = MODELS_DIR / "yolov8m.engine"
+        try:
+            if _export_once(engine_path, format="engine", half=True, dynamic=True,
+                            batch=8, imgsz=DETECT_IMGSZ):
+                return YOLO(str(engine_path), task="detect")
+        except Exception as e:
+            logger.warning(f"TensorRT engine unavailable, using PyTorch weights: {e}")
+    else:
+        # Sem GPU: modelo INT8 no OpenVINO (usa as instruções VNNI da CPU)
+        openvino_dir = MODELS_DIR / "yolov8m_int8_openvino_model"
+        try:
+            if _export_once(openvino_dir, format="openvino", int8=True,
+                            data="coco128.yaml", imgsz=DETECT_IMGSZ):
+                return YOLO(str(openvino_dir), task="detect")
+        except Exception as e:
+            logger.warning(f"OpenVINO INT8 model unavailable, using PyTorch weights: {e}")
+
+    return YOLO(YOLO_MODEL)
+
+
+@lru_cache(maxsize=1)
+def _gstreamer_available() -> bool:
+    import cv2
+
+    for line in cv2.getBuildInformation().splitlines():
+        if "GStreamer" in line:
+            return "YES" in line
+    return False
+
+
+def _gstreamer_pipeline(rtsp_url: str) -> str:
+    """Pipeline GStreamer do RTSP, com a URL entre aspas e escapada"""
+    # Sem aspas, espaços ou "!" na URL (ex.: na senha) quebrariam o pipeline
+    location = rtsp_url.replace("\\", "\\\\").replace('"', '\\"')
+    # decodebin escolhe nvh264dec/vaapih264dec quando o plugin existe
+    return (
+        f'rtspsrc location="{location}" latency=100 ! decodebin ! videoconvert ! '
+        "video/x-raw,format=BGR ! appsink drop=1 max-buffers=1 sync=false"
+    )
+
+
+def _open_rtsp_capture(rtsp_url: str):
+    """Abre o RTSP decodificando em hardware (NVDEC/VA-API) via GStreamer, se houver"""
+    import cv2
+
+    if _gstreamer_available():
+        cap = cv2.VideoCapture(_gstreamer_pipeline(rtsp_url), cv2.CAP_GSTREAMER)
+        if cap.isOpened():
+            return cap
+        cap.release()
+        logger.warning("GStreamer pipeline failed, falling back to FFmpeg")
+
+    cap = cv2.VideoCapture(rtsp_url, cv2.CAP_FFMPEG)
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+    return cap
+
+
+class YoloBatchService:
+    """Detector YOLO único que agrupa os frames de todas as câmeras num só forward"""
+
+    def __init__(self, max_batch: int = 8):
+        import numpy as np
+
+        self.max_batch = max_batch
+        self.model = None
+        self.half = _cuda_available()
+        self.suspicious_ids = np.empty(0, np.int32)
+        self._queue = queue.Queue()
+
+        try:
+            self.model = _load_yolo_model()
+            # IDs das classes suspeitas, resolvidos uma vez a partir de model.names
+            self.suspicious_ids = np.array(
+                sorted(i for i, name in self.model.names.items() if name in SUSPICIOUS_CLASSES),
+                dtype=np.int32
+            )
+            logger.info("✓ YOLO detector initialized")
+        except Exception as e:
+            logger.warning(f"Failed to initialize YOLO: {e}")
+            return
+
+        self._thread = threading.Thread(target=self._run, daemon=True, name="YoloBatchService")
+        self._thread.start()
+
+    def submit(self, frame) -> Future:
+        """Enfileira um frame; o resultado chega no Future"""
+        future = Future()
+        self._queue.put((frame, future))
+        return future
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+
+            # Junta o que chegar das outras câmeras em até 10 ms
+            deadline = time.monotonic() + 0.01
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                # Caixas voltam nas coordenadas do frame original
+                results = self.model(
+                    [frame for frame, _ in batch],
+                    conf=0.4, imgsz=DETECT_IMGSZ, half=self.half, verbose=False
+                )
+            except Exception as e:
+                logger.error(f"Detection error: {e}")
+                results = [None] * len(batch)
+
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
+
+
+@dataclass
+class Detections:
+    """Detecções de um frame em arrays paralelos (uma posição por caixa)"""
+    boxes: "np.ndarray"       # (N, 4) int32: x1, y1, x2, y2
+    conf: "np.ndarray"        # (N,) float32
+    class_ids: "np.ndarray"   # (N,) int32
+    suspicious: "np.ndarray"  # (N,) bool
+    names: dict = field(default_factory=dict)
+
+    @classmethod
+    def empty(cls) -> "Detections":
+        import numpy as np
+
+        return cls(
+            np.empty((0, 4), np.int32), np.empty(0, np.float32),
+            np.empty(0, np.int32), np.empty(0, bool)
+        )
+
+    @classmethod
+    def from_result(cls, result, suspicious_ids: "np.ndarray") -> "Detections":
+        """Monta direto dos tensores do ultralytics, sem objeto por caixa"""
+        import numpy as np
+
+        boxes = result.boxes
+        class_ids = boxes.cls.cpu().numpy().astype(np.int32)
+        return cls(
+            boxes.xyxy.cpu().numpy().astype(np.int32),
+            boxes.conf.cpu().numpy().astype(np.float32),
+            class_ids,
+            np.isin(class_ids, suspicious_ids),
+            result.names,
+        )
+
+    def __len__(self) -> int:
+        return len(self.conf)
+
+
+_YOLO_SINGLETON = None
+_YOLO_LOCK = threading.Lock()
+
+
+def get_detector() -> YoloBatchService:
+    """Detector compartilhado; o lock garante uma só carga do modelo entre threads"""
+    global _YOLO_SINGLETON
+    if _YOLO_SINGLETON is None:
+        with _YOLO_LOCK:
+            if _YOLO_SINGLETON is None:
+                _YOLO_SINGLETON = YoloBatchService()
+    return _YOLO_SINGLETON
+
+
+class FrameGrabber(QThread):
+    """Lê o stream sem parar e guarda só o frame mais recente (buffer duplo reaproveitado)"""
+
+    def __init__(self, cap):
+        super().__init__()
+        self._cap = cap
+        self.running = True
+        self._mutex = QMutex()
+        self._new_frame = QWaitCondition()
+        self._frame = None
+        self._back = None
+        self._seq = 0
+        self._failed = False
+
+    def run(self):
+        while self.running:
+            if not self._cap.grab():
+                self._mutex.lock()
+                self._failed = True
+                self._new_frame.wakeAll()
+                self._mutex.unlock()
+                break
+            # Decodifica no buffer de trás e troca com o da frente sob o lock
+            ret, frame = self._cap.retrieve(self._back)
+            if not ret:
+                continue
+            self._mutex.lock()
+            self._back = self._frame
+            self._frame = frame
+            self._seq += 1
+            self._new_frame.wakeAll()
+            self._mutex.unlock()
+
+    def latest(self, last_seq: int, timeout_ms: int = 5000):
+        """Espera um frame mais novo que last_seq; retorna (seq, cópia do frame) ou (last_seq, None)"""
+        self._mutex.lock()
+        try:
+            if self._seq == last_seq and not self._failed:
+                self._new_frame.wait(self._mutex, timeout_ms)
+            if self._seq == last_seq:
+                return last_seq, None
+            return self._seq, self._frame.copy()
+        finally:
+            self._mutex.unlock()
+
+    def stop(self):
+        self.running = False
+        self.wait()
+
+
 class VideoThread(QThread):
     """Thread para capturar frames de vídeo RTSP com detecção YOLO"""
-    frame_ready = Signal(np.ndarray, list)  # frame, detections
+    frame_ready = Signal(object, object)  # frame (np.ndarray), Detections
     error_occurred = Signal(str)
     
     def __init__(self, rtsp_url):
@@ -31,59 +310,53 @@ class VideoThread(QThread):
         self.rtsp_url = rtsp_url
         self.running = True
         self.detector = None
+        # Detecção a cada det_every frames (~10 Hz a 30 fps); entre elas reaproveita a última
+        self.det_every = 3
+        self.last_dets = Detections.empty()
         
     def run(self):
-        # Inicializar detector YOLO
-        try:
-            from ultralytics import YOLO
-            self.detector = YOLO("yolov8m.pt")
-            logger.info("✓ YOLO detector initialized")
-        except Exception as e:
-            logger.warning(f"Failed to initialize YOLO: {e}")
-            self.detector = None
+        # Detector compartilhado entre todas as câmeras
+        self.detector = get_detector()
         
-        cap = cv2.VideoCapture(self.rtsp_url, cv2.CAP_FFMPEG)
-        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        cap = _open_rtsp_capture(self.rtsp_url)
         
         if not cap.isOpened():
             self.error_occurred.emit("Failed to open stream")
             return
         
-        # Classes suspeitas para alertar
-        suspicious_classes = ["person", "knife", "scissors", "backpack", "handbag", "suitcase"]
+        # Captura separada: o loop sempre pega o frame mais novo, sem fila
+        grabber = FrameGrabber(cap)
+        grabber.start()
+        seq = 0
+        frame_idx = 0
         
         while self.running:
-            ret, frame = cap.read()
-            if ret and frame is not None:
-                detections = []
+            seq, frame = grabber.latest(seq)
+            if frame is not None:
+                run_detection = frame_idx % self.det_every == 0
+                frame_idx += 1
+                if not run_detection:
+                    self.frame_ready.emit(frame, self.last_dets)
+                    continue
+                
+                detections = Detections.empty()
                 
-                # Processar com YOLO
-                if self.detector:
+                # Processar com YOLO; cada câmera tem no máximo um frame na fila
+                if self.detector.model is not None:
                     try:
-                        results = self.detector(frame, conf=0.4, verbose=False)
-                        for result in results:
-                            for box in result.boxes:
-                                x1, y1, x2, y2 = map(int, box.xyxy[0])
-                                conf = float(box.conf[0])
-                                class_id = int(box.cls[0])
-                                class_name = result.names[class_id]
-                                
-                                detections.append({
-                                    'bbox': (x1, y1, x2, y2),
-                                    'class': class_name,
-                                    'conf': conf,
-                                    'suspicious': class_name in suspicious_classes
-                                })
+                        result = self.detector.submit(frame).result()
+                        if result is not None:
+                            detections = Detections.from_result(result, self.detector.suspicious_ids)
                     except Exception as e:
                         logger.error(f"Detection error: {e}")
                 
+                self.last_dets = detections
                 self.frame_ready.emit(frame, detections)
-            else:
+            elif self.running:
                 self.error_occurred.emit("Lost connection")
                 break
-            
-            self.msleep(30)  # ~30 FPS
         
+        grabber.stop()
         cap.release()
     
     def stop(self):
@@ -91,6 +364,28 @@ class VideoThread(QThread):
         self.wait()
 
 
+# Rótulo com tamanho estimado: FONT_HERSHEY_SIMPLEX 0.6 tem ~16 px de altura e ~10 px por caractere
+_LABEL_HEIGHT = 16
+_LABEL_CHAR_WIDTH = 10
+
+
+def _overlay_geometry(boxes, label_lens):
+    """Retângulos dos rótulos e origem do texto para todas as caixas, numa passada
+
+    Retorna (N, 6) int32: lx1, ly1, lx2, ly2, tx, ty.
+    """
+    import numpy as np
+
+    geometry = np.empty((len(boxes), 6), np.int32)
+    geometry[:, 0] = boxes[:, 0]
+    geometry[:, 1] = boxes[:, 1] - _LABEL_HEIGHT - 10
+    geometry[:, 2] = boxes[:, 0] + label_lens * _LABEL_CHAR_WIDTH
+    geometry[:, 3] = boxes[:, 1]
+    geometry[:, 4] = boxes[:, 0]
+    geometry[:, 5] = boxes[:, 1] - 5
+    return geometry
+
+
 class LiveViewDialog(QDialog):
     """Janela para visualização ao vivo"""
     
@@ -99,6 +394,15 @@ class LiveViewDialog(QDialog):
         self.rtsp_url = rtsp_url
         self.camera_name = camera_name
         self.video_thread = None
+        self._display_buf = None
+        self._qimage = None
+        # Último frame recebido; desenhado pelo timer na cadência da tela
+        self._pending_frame = None
+        self._pending_dets = None
+        self._render_timer = QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(33)
+        self._render_timer.timeout.connect(self._render)
         self.setup_ui()
         self.start_stream()
     
@@ -139,54 +443,80 @@ class LiveViewDialog(QDialog):
     def start_stream(self):
         """Inicia thread de captura"""
         self.video_thread = VideoThread(self.rtsp_url)
-        self.video_thread.frame_ready.connect(self.update_frame)
+        self.video_thread.frame_ready.connect(self._stash)
         self.video_thread.error_occurred.connect(self.handle_error)
         self.video_thread.start()
+        self._render_timer.start()
+    
+    def _stash(self, frame, detections):
+        """Só guarda o frame; quem desenha é _render"""
+        self._pending_frame = frame
+        self._pending_dets = detections
+    
+    def _render(self):
+        """Desenha o frame mais recente e se reagenda; nada a fazer se oculta/minimizada"""
+        try:
+            if (self._pending_frame is None or not self.isVisible()
+                    or self.windowState() & Qt.WindowState.WindowMinimized):
+                return
+            frame, detections = self._pending_frame, self._pending_dets
+            self._pending_frame = None
+            self.update_frame(frame, detections)
+        finally:
+            self._render_timer.start()
     
     def update_frame(self, frame, detections):
         """Atualiza frame no QLabel com bounding boxes"""
+        import cv2
+        import numpy as np
+
         try:
-            # Fazer cópia para desenhar
-            display_frame = frame.copy()
+            # Buffer de desenho reaproveitado entre frames; a QImage lê direto dele em BGR
+            if self._display_buf is None or self._display_buf.shape != frame.shape:
+                self._display_buf = np.empty_like(frame)
+                h, w = frame.shape[:2]
+                self._qimage = QImage(
+                    self._display_buf.data, w, h, self._display_buf.strides[0],
+                    QImage.Format.Format_BGR888
+                )
+            np.copyto(self._display_buf, frame)
+            display_frame = self._display_buf
             
-            # Desenhar detecções
+            # Geometria e cores de todas as detecções de uma vez
             suspicious_count = 0
-            for det in detections:
-                x1, y1, x2, y2 = det['bbox']
-                class_name = det['class']
-                conf = det['conf']
-                is_suspicious = det['suspicious']
-                
+            if len(detections):
+                boxes = detections.boxes
+                suspicious = detections.suspicious
                 # Cor: vermelho se suspeito, verde se normal
-                color = (0, 0, 255) if is_suspicious else (0, 255, 0)
-                
-                # Desenhar bbox
-                cv2.rectangle(display_frame, (x1, y1), (x2, y2), color, 2)
+                colors = np.where(suspicious[:, None], (0, 0, 255), (0, 255, 0))
+                labels = [
+                    f"{detections.names[class_id]} {conf:.2f}"
+                    for class_id, conf in zip(detections.class_ids.tolist(), detections.conf.tolist())
+                ]
+                geometry = _overlay_geometry(
+                    boxes, np.fromiter(map(len, labels), np.int32, len(labels))
+                )
                 
-                # Label
-                label = f"{class_name} {conf:.2f}"
-                label_size, _ = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2)
-                cv2.rectangle(display_frame, (x1, y1 - label_size[1] - 10), 
-                             (x1 + label_size[0], y1), color, -1)
-                cv2.putText(display_frame, label, (x1, y1 - 5),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+                for (x1, y1, x2, y2), (lx1, ly1, lx2, ly2, tx, ty), color, label in zip(
+                    boxes.tolist(), geometry.tolist(), colors.tolist(), labels
+                ):
+                    cv2.rectangle(display_frame, (x1, y1), (x2, y2), color, 2)
+                    cv2.rectangle(display_frame, (lx1, ly1), (lx2, ly2), color, -1)
+                    cv2.putText(display_frame, label, (tx, ty),
+                               cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
                 
-                if is_suspicious:
-                    suspicious_count += 1
+                suspicious_count = int(suspicious.sum())
             
-            # Converter BGR para RGB
-            rgb_frame = cv2.cvtColor(display_frame, cv2.COLOR_BGR2RGB)
-            h, w, ch = rgb_frame.shape
-            bytes_per_line = ch * w
+            h, w = display_frame.shape[:2]
             
-            # Criar QImage
-            qt_image = QImage(rgb_frame.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
-            
-            # Redimensionar mantendo aspecto
-            scaled_pixmap = QPixmap.fromImage(qt_image).scaled(
-                self.video_label.size(),
+            # Redimensionar mantendo aspecto; reduzir não precisa de filtro suave
+            target = self.video_label.size()
+            downscale = w > target.width() or h > target.height()
+            scaled_pixmap = QPixmap.fromImage(self._qimage).scaled(
+                target,
                 Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
+                Qt.TransformationMode.FastTransformation if downscale
+                else Qt.TransformationMode.SmoothTransformation
             )
             
             self.video_label.setPixmap(scaled_pixmap)
@@ -205,25 +535,94 @@ class LiveViewDialog(QDialog):
     
     def handle_error(self, error_msg):
         """Trata erros de stream"""
+        self._render_timer.stop()
         self.video_label.setText(f"✗ Stream Error\n\n{error_msg}")
         self.status_label.setText("Disconnected")
     
     def closeEvent(self, event):
         """Para thread ao fechar"""
+        self._render_timer.stop()
         if self.video_thread:
             self.video_thread.stop()
         event.accept()
 
 
+class _ProbeSignals(QObject):
+    """Resultado do teste de conexão, entregue na thread da GUI"""
+    succeeded = Signal(int, str, int, int)  # geração, backend, largura, altura
+    failed = Signal(int, str, str)          # geração, backend, detalhe
+
+
+class RtspProbe(QRunnable):
+    """Tenta ler um frame do RTSP com um backend; desiste quando cancel é sinalizado"""
+
+    def __init__(self, rtsp_url, backend, backend_name, cancel: threading.Event,
+                 generation: int, timeout: float = 10.0):
+        super().__init__()
+        self.signals = _ProbeSignals()
+        self._rtsp_url = rtsp_url
+        self._backend = backend
+        self._backend_name = backend_name
+        self._cancel = cancel
+        self._generation = generation
+        self._timeout = timeout
+
+    def run(self):
+        import cv2
+
+        try:
+            logger.info(f"Tentando conectar via {self._backend_name}: {self._rtsp_url}")
+
+            # Configurar VideoCapture com buffer mínimo
+            cap = cv2.VideoCapture(self._rtsp_url, getattr(cv2, self._backend))
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            try:
+                deadline = time.monotonic() + self._timeout
+                while time.monotonic() < deadline and not self._cancel.is_set():
+                    if cap.isOpened():
+                        ret, frame = cap.read()
+                        if ret and frame is not None:
+                            h, w = frame.shape[:2]
+                            logger.info(f"✓ Conectado via {self._backend_name}: {w}x{h}")
+                            self.signals.succeeded.emit(self._generation, self._backend_name, w, h)
+                            return
+                    time.sleep(0.2)
+            finally:
+                cap.release()
+
+            self.signals.failed.emit(
+                self._generation, self._backend_name, f"timeout após {self._timeout:g}s"
+            )
+        except Exception as e:
+            logger.error(f"Erro com {self._backend_name}: {e}")
+            self.signals.failed.emit(self._generation, self._backend_name, str(e))
+
+
 class CamerasPage(QWidget):
     """Camera management page."""
 
+    # Câmera adicionada ou removida
+    cameras_changed = Signal()
+
+    # Backends testados em paralelo por test_connection
+    _PROBE_BACKENDS = (("CAP_FFMPEG", "FFmpeg"), ("CAP_ANY", "Auto"))
+
     def __init__(self, db_manager, auth_manager, camera_manager, engine_manager):
         super().__init__()
         self.db_manager = db_manager
         self.auth_manager = auth_manager
         self.camera_manager = camera_manager
         self.engine_manager = engine_manager
+        self._probe_generation = 0
+        self._probe_cancel = None
+        self._probe_url = ""
+        self._probe_failures = []
+        # camera_id -> itens da linha; _row_ids espelha a ordem da tabela
+        self._row_cache = {}
+        self._row_ids = []
+        # Pool próprio: probes passam a maior parte do tempo bloqueados em rede, um por backend
+        self._probe_pool = QThreadPool(self)
+        self._probe_pool.setMaxThreadCount(len(self._PROBE_BACKENDS))
         self.setup_ui()
 
     def setup_ui(self):
@@ -323,6 +722,7 @@ class CamerasPage(QWidget):
             self.camera_name.clear()
             self.rtsp_url.clear()
             self.refresh()
+            self.cameras_changed.emit()
         except Exception as e:
             logger.error(f"Error adding camera: {e}")
             self.show_status(f"✗ Failed to add camera: {e}", "error")
@@ -366,6 +766,7 @@ class CamerasPage(QWidget):
                 self.device_password.clear()
                 self.cloud_user.clear()
                 self.refresh()
+                self.cameras_changed.emit()
             else:
                 self.show_status(f"✗ Could not connect to device {device_id}", "error")
                 
@@ -411,87 +812,59 @@ class CamerasPage(QWidget):
             self.show_status("✗ Please enter RTSP URL", "error")
             return
 
-        # Testar conexão RTSP real com diagnóstico detalhado
-        try:
-            import cv2
-            import time
-            
-            # Feedback inline durante teste
-            self.show_status("⟳ Testing RTSP connection... (up to 10 seconds)", "info", duration=0)
-            QApplication.processEvents()
-            
-            # Configurações para melhor compatibilidade
-            backends = [
-                (cv2.CAP_FFMPEG, "FFmpeg"),
-                (cv2.CAP_ANY, "Auto")
-            ]
-            
-            success = False
-            error_details = []
-            backend_used = ""
-            
-            for backend, backend_name in backends:
-                try:
-                    logger.info(f"Tentando conectar via {backend_name}: {rtsp_url}")
-                    
-                    # Configurar VideoCapture com timeout e buffer mínimo
-                    cap = cv2.VideoCapture(rtsp_url, backend)
-                    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
-                    
-                    # Aguardar até 10 segundos
-                    timeout = 10.0
-                    start = time.time()
-                    
-                    while time.time() - start < timeout:
-                        if cap.isOpened():
-                            ret, frame = cap.read()
-                            if ret and frame is not None:
-                                h, w = frame.shape[:2]
-                                success = True
-                                backend_used = backend_name
-                                logger.info(f"✓ Conectado via {backend_name}: {w}x{h}")
-                                break
-                        time.sleep(0.2)
-                        QApplication.processEvents()
-                    
-                    cap.release()
-                    
-                    if success:
-                        break
-                    else:
-                        error_details.append(f"{backend_name}: timeout após {timeout}s")
-                        
-                except Exception as e:
-                    error_details.append(f"{backend_name}: {str(e)}")
-                    logger.error(f"Erro com {backend_name}: {e}")
-            
-            if success:
-                self.show_status(
-                    f"✓ Connected via {backend_used}! Resolution: {w}x{h}",
-                    "success",
-                    8000
-                )
-            else:
-                # Diagnóstico detalhado
-                diagnostics = "\n".join([
-                    "✗ Connection failed",
-                    f"URL: {rtsp_url}",
-                    "",
-                    "Tried:",
-                ] + [f"  • {detail}" for detail in error_details] + [
-                    "",
-                    "Common issues:",
-                    "  • Wrong port (try 554, 8080, 8554)",
-                    "  • Wrong path (try /h264, /stream, /cam/realmonitor)",
-                    "  • Authentication required (add user:pass@ before IP)",
-                    "  • Camera not on network or firewall blocking"
-                ])
-                
-                self.show_status(diagnostics, "error", 15000)
-                logger.warning(f"RTSP test failed: {rtsp_url}")
-                
-        except Exception as e:
-            self.show_status(f"✗ Test failed: {str(e)}", "error")
+        # Cancela probes de um teste anterior ainda em andamento
+        if self._probe_cancel is not None:
+            self._probe_cancel.set()
+
+        # Testar conexão RTSP real com diagnóstico detalhado; os backends rodam em paralelo
+        self._probe_generation += 1
+        self._probe_cancel = threading.Event()
+        self._probe_url = rtsp_url
+        self._probe_failures = []
+
+        self.show_status("⟳ Testing RTSP connection... (up to 10 seconds)", "info", duration=0)
+
+        for backend, backend_name in self._PROBE_BACKENDS:
+            probe = RtspProbe(rtsp_url, backend, backend_name, self._probe_cancel, self._probe_generation)
+            probe.signals.succeeded.connect(self._on_probe_succeeded)
+            probe.signals.failed.connect(self._on_probe_failed)
+            self._probe_pool.start(probe)
+
+    def _on_probe_succeeded(self, generation: int, backend_name: str, w: int, h: int):
+        # Primeiro resultado vence; o outro probe já foi cancelado
+        if generation != self._probe_generation or self._probe_cancel.is_set():
+            return
+        self._probe_cancel.set()
+        self.show_status(
+            f"✓ Connected via {backend_name}! Resolution: {w}x{h}",
+            "success",
+            8000
+        )
+
+    def _on_probe_failed(self, generation: int, backend_name: str, detail: str):
+        if generation != self._probe_generation or self._probe_cancel.is_set():
+            return
+        self._probe_failures.append(f"{backend_name}: {detail}")
+        if len(self._probe_failures) < len(self._PROBE_BACKENDS):
+            return
+
+        # Diagnóstico detalhado
+        diagnostics = "\n".join([
+            "✗ Connection failed",
+            f"URL: {self._probe_url}",
+            "",
+            "Tried:",
+        ] + [f"  • {detail}" for detail in self._probe_failures] + [
+            "",
+            "Common issues:",
+            "  • Wrong port (try 554, 8080, 8554)",
+            "  • Wrong path (try /h264, /stream, /cam/realmonitor)",
+            "  • Authentication required (add user:pass@ before IP)",
+            "  • Camera not on network or firewall blocking"
+        ])
+
+        self.show_status(diagnostics, "error", 15000)
+        logger.warning(f"RTSP test failed: {self._probe_url}")
     
     def view_live(self, rtsp_url, camera_name):
         """Navega para visualização ao vivo"""
@@ -518,42 +891,93 @@ class CamerasPage(QWidget):
             user_id = self.auth_manager.get_user_id()
             if not user_id:
                 self.cameras_table.setRowCount(0)
+                self._row_cache.clear()
+                self._row_ids.clear()
                 return
 
             cameras = self.db_manager.get_cameras(user_id)
-            self.cameras_table.setRowCount(len(cameras))
+            current_ids = {camera["id"] for camera in cameras}
 
-            for row, camera in enumerate(cameras):
-                camera_id = camera["id"]
-                status = self.camera_manager.get_camera_status(camera_id)
-                status_text = status.get("status", "offline") if status else "offline"
-
-                self.cameras_table.setItem(row, 0, QTableWidgetItem(str(camera_id)))
-                self.cameras_table.setItem(row, 1, QTableWidgetItem(camera["name"]))
-                self.cameras_table.setItem(row, 2, QTableWidgetItem(camera["rtsp_url"]))
-                self.cameras_table.setItem(row, 3, QTableWidgetItem(status_text.capitalize()))
-                
-                # Botões de ação (Delete)
-                actions_widget = QWidget()
-                actions_layout = QHBoxLayout()
-                actions_layout.setContentsMargins(4, 2, 4, 2)
-                actions_layout.setSpacing(4)
-                
-                delete_btn = QPushButton("Delete")
-                delete_btn.setMaximumWidth(70)
-                delete_btn.clicked.connect(lambda checked, cid=camera_id: self.delete_camera(cid))
-                actions_layout.addWidget(delete_btn)
-                
-                actions_widget.setLayout(actions_layout)
-                self.cameras_table.setCellWidget(row, 4, actions_widget)
-                
-                # Botão View Live
-                view_btn = QPushButton("View Live")
-                view_btn.setMaximumWidth(90)
-                view_btn.clicked.connect(lambda checked, url=camera["rtsp_url"], name=camera["name"]: self.view_live(url, name))
-                self.cameras_table.setCellWidget(row, 5, view_btn)
+            # Só as linhas que mudaram são tocadas; os widgets das demais são mantidos
+            self.cameras_table.setUpdatesEnabled(False)
+            try:
+                for camera_id in [cid for cid in self._row_ids if cid not in current_ids]:
+                    self.cameras_table.removeRow(self._row_ids.index(camera_id))
+                    self._row_ids.remove(camera_id)
+                    del self._row_cache[camera_id]
+
+                for row, camera in enumerate(cameras):
+                    camera_id = camera["id"]
+                    status = self.camera_manager.get_camera_status(camera_id)
+                    status_text = status.get("status", "offline") if status else "offline"
+
+                    if row < len(self._row_ids) and self._row_ids[row] == camera_id:
+                        self._update_row(camera, status_text)
+                        continue
+
+                    if camera_id in self._row_cache:
+                        # Mudou de posição: recria no lugar certo
+                        self.cameras_table.removeRow(self._row_ids.index(camera_id))
+                        self._row_ids.remove(camera_id)
+                    self.cameras_table.insertRow(row)
+                    self._row_ids.insert(row, camera_id)
+                    self._create_row(row, camera, status_text)
+            finally:
+                self.cameras_table.setUpdatesEnabled(True)
         except Exception as e:
             logger.error(f"Error refreshing cameras: {e}")
+
+    def _create_row(self, row, camera, status_text):
+        camera_id = camera["id"]
+        entry = {
+            "name_item": QTableWidgetItem(camera["name"]),
+            "url_item": QTableWidgetItem(camera["rtsp_url"]),
+            "status_item": QTableWidgetItem(status_text.capitalize()),
+            "name": camera["name"],
+            "rtsp_url": camera["rtsp_url"],
+        }
+        self._row_cache[camera_id] = entry
+
+        self.cameras_table.setItem(row, 0, QTableWidgetItem(str(camera_id)))
+        self.cameras_table.setItem(row, 1, entry["name_item"])
+        self.cameras_table.setItem(row, 2, entry["url_item"])
+        self.cameras_table.setItem(row, 3, entry["status_item"])
+        
+        # Botões de ação (Delete)
+        actions_widget = QWidget()
+        actions_layout = QHBoxLayout()
+        actions_layout.setContentsMargins(4, 2, 4, 2)
+        actions_layout.setSpacing(4)
+        
+        delete_btn = QPushButton("Delete")
+        delete_btn.setMaximumWidth(70)
+        delete_btn.clicked.connect(lambda checked, cid=camera_id: self.delete_camera(cid))
+        actions_layout.addWidget(delete_btn)
+        
+        actions_widget.setLayout(actions_layout)
+        self.cameras_table.setCellWidget(row, 4, actions_widget)
+        
+        # Botão View Live; lê nome/URL do cache para acompanhar edições
+        view_btn = QPushButton("View Live")
+        view_btn.setMaximumWidth(90)
+        view_btn.clicked.connect(
+            lambda checked, cid=camera_id: self.view_live(
+                self._row_cache[cid]["rtsp_url"], self._row_cache[cid]["name"]
+            )
+        )
+        self.cameras_table.setCellWidget(row, 5, view_btn)
+
+    def _update_row(self, camera, status_text):
+        entry = self._row_cache[camera["id"]]
+        if entry["name"] != camera["name"]:
+            entry["name"] = camera["name"]
+            entry["name_item"].setText(camera["name"])
+        if entry["rtsp_url"] != camera["rtsp_url"]:
+            entry["rtsp_url"] = camera["rtsp_url"]
+            entry["url_item"].setText(camera["rtsp_url"])
+        status_label = status_text.capitalize()
+        if entry["status_item"].text() != status_label:
+            entry["status_item"].setText(status_label)
     
     def delete_camera(self, camera_id):
         """Deleta câmera"""
@@ -562,6 +986,7 @@ class CamerasPage(QWidget):
             self.camera_manager.remove_camera_processor(camera_id)
             self.show_status(f"✓ Camera deleted successfully", "success")
             self.refresh()
+            self.cameras_changed.emit()
         except Exception as e:
             logger.error(f"Error deleting camera: {e}")
             self.show_status(f"✗ Failed to delete camera: {e}", "error")
@@ -21,10 +21,12 @@ class DashboardPage(QWidget):
         super().__init__()
         self.db_manager = db_manager
         self.alert_manager = alert_manager
+        self._last_alert_sig = None
         self.setup_ui()
 
         # Timer para atualizar dados
         self.update_timer = QTimer()
+        self.update_timer.setTimerType(Qt.TimerType.VeryCoarseTimer)  # permite agrupar wakeups
         self.update_timer.timeout.connect(self.auto_refresh)
         self.update_timer.start(10000)  # Atualizar a cada 10 segundos
 
@@ -122,6 +124,12 @@ class DashboardPage(QWidget):
     def auto_refresh(self):
         """Atualiza automaticamente os dados"""
         try:
+            # Nada mudou desde a última atualização: nenhum trabalho de UI
+            signature = self.alert_manager.get_alert_signature()
+            if signature == self._last_alert_sig:
+                return
+            self._last_alert_sig = signature
+
             # Atualizar alertas
             alerts = self.alert_manager.get_active_alerts()
             unacknowledged = [a for a in alerts if not a.acknowledged]
@@ -31,6 +31,7 @@ class DiagnosticsPage(QWidget):
 
         # Timer para atualização automática
         self.update_timer = QTimer()
+        self.update_timer.setTimerType(Qt.TimerType.VeryCoarseTimer)  # permite agrupar wakeups
         self.update_timer.timeout.connect(self.refresh_diagnostics)
         self.update_timer.start(5000)  # Atualizar a cada 5 segundos
 
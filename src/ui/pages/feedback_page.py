@@ -27,6 +27,7 @@ class FeedbackPage(QWidget):
 
         # Timer para atualização automática
         self.update_timer = QTimer()
+        self.update_timer.setTimerType(Qt.TimerType.VeryCoarseTimer)  # permite agrupar wakeups
         self.update_timer.timeout.connect(self.load_feedback_data)
         self.update_timer.start(30000)  # Atualizar a cada 30 segundos
 
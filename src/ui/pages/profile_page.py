@@ -115,7 +115,7 @@ class ProfilePage(QWidget):
             return
         
         # Get username
-        username = self.auth_manager.username
+        username = self.auth_manager.current_user['username']
         self.username_label.setText(username or "N/A")
         
         # Get email
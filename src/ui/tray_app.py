@@ -184,11 +184,12 @@ class EngineManager:
             logger.error(f"Failed to start engine: {e}")
             return False
 
-    def stop(self):
+    def stop(self, stop_processors: bool = True):
         try:
             logger.info("Stopping processing engine...")
 
-            self.camera_manager.stop_all_processors()
+            if stop_processors:
+                self.camera_manager.stop_all_processors()
             self._stop_watchdog()
 
             self.is_running = False
@@ -203,6 +204,7 @@ class EngineManager:
         from PySide6.QtCore import QTimer
 
         self.watchdog_timer = QTimer()
+        self.watchdog_timer.setTimerType(Qt.TimerType.VeryCoarseTimer)  # permite agrupar wakeups
         self.watchdog_timer.timeout.connect(self._check_health)
         self.watchdog_timer.start(self.health_check_interval * 1000)
 
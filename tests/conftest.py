@@ -0,0 +1,19 @@
+"""
+Configuração compartilhada dos testes de interface
+"""
+import os
+import sys
+from pathlib import Path
+
+# Antes de qualquer import do Qt: os testes rodam sem display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    from PySide6.QtWidgets import QApplication
+
+    return QApplication.instance() or QApplication([])
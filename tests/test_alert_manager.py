@@ -0,0 +1,88 @@
+"""
+Testes para AlertManager
+"""
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+from src.core.alert_manager import AlertManager
+
+
+@pytest.fixture
+def mock_db_manager():
+    """Fixture com mock do database manager"""
+    db = Mock()
+    db.add_alert = Mock(side_effect=range(1, 1000))
+    db.acknowledge_alert = Mock()
+    return db
+
+
+@pytest.fixture
+def alert_manager(mock_db_manager):
+    """Fixture que cria um alert manager sem email"""
+    return AlertManager(mock_db_manager)
+
+
+class TestUnacknowledgedCount:
+    """Testes do contador incremental de alertas não reconhecidos"""
+
+    def test_starts_at_zero(self, alert_manager):
+        assert alert_manager.active_unacknowledged_count == 0
+
+    def test_create_increments(self, alert_manager):
+        alert_manager.create_alert(0, 1, "intrusion", "high")
+        alert_manager.create_alert(0, 1, "loitering", "low")
+        assert alert_manager.active_unacknowledged_count == 2
+
+    def test_acknowledge_decrements_once(self, alert_manager):
+        alert = alert_manager.create_alert(0, 1, "intrusion", "high")
+        alert_manager.acknowledge_alert(alert.alert_id)
+        alert_manager.acknowledge_alert(alert.alert_id)
+        assert alert_manager.active_unacknowledged_count == 0
+
+    def test_acknowledge_unknown_alert(self, alert_manager):
+        alert_manager.create_alert(0, 1, "intrusion", "high")
+        alert_manager.acknowledge_alert(999)
+        assert alert_manager.active_unacknowledged_count == 1
+
+    def test_clear_old_alerts_recounts(self, alert_manager):
+        old = alert_manager.create_alert(0, 1, "intrusion", "high")
+        alert_manager.create_alert(0, 1, "loitering", "low")
+        old.timestamp = datetime.now() - timedelta(days=10)
+        alert_manager.clear_old_alerts(days=7)
+        assert alert_manager.active_unacknowledged_count == 1
+
+
+class TestUnacknowledgedSignal:
+    """Testes do sinal unacknowledged_changed"""
+
+    def test_emits_on_create_and_acknowledge(self, alert_manager):
+        received = []
+        alert_manager.signals.unacknowledged_changed.connect(received.append)
+        alert = alert_manager.create_alert(0, 1, "intrusion", "high")
+        alert_manager.acknowledge_alert(alert.alert_id)
+        alert_manager.acknowledge_alert(alert.alert_id)
+        assert received == [1, 0]
+
+    def test_clear_without_change_does_not_emit(self, alert_manager):
+        alert_manager.create_alert(0, 1, "intrusion", "high")
+        received = []
+        alert_manager.signals.unacknowledged_changed.connect(received.append)
+        alert_manager.clear_old_alerts(days=7)
+        assert received == []
+
+    def test_new_alert_emits_alert(self, alert_manager):
+        received = []
+        alert_manager.signals.new_alert.connect(received.append)
+        alert = alert_manager.create_alert(0, 1, "intrusion", "high")
+        assert received == [alert]
+
+
+class TestAlertSignature:
+    """Testes de get_alert_signature"""
+
+    def test_signature_changes_on_create_and_acknowledge(self, alert_manager):
+        assert alert_manager.get_alert_signature() == (0, 0)
+        alert = alert_manager.create_alert(0, 1, "intrusion", "high")
+        assert alert_manager.get_alert_signature() == (1, alert.alert_id)
+        alert_manager.acknowledge_alert(alert.alert_id)
+        assert alert_manager.get_alert_signature() == (0, alert.alert_id)
@@ -0,0 +1,206 @@
+"""
+Testes para a página de histórico de alertas
+"""
+import time
+
+import pytest
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+
+from src.core.database import DatabaseManager
+from src.ui.pages.alerts_history_page import AlertsHistoryPage, PAGE_SIZE
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    db = DatabaseManager(tmp_path / "alerts.db")
+    yield db
+    db.disconnect()
+
+
+@pytest.fixture
+def page(qapp, db_manager):
+    page = AlertsHistoryPage(db_manager)
+    yield page
+    page.stop_fetcher()
+
+
+def _wait(page, timeout=3.0):
+    """Processa eventos até o worker responder"""
+    app = QApplication.instance()
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        app.processEvents()
+        if not page._in_flight and not page._reload_timer.isActive():
+            app.processEvents()
+            return
+        time.sleep(0.01)
+    pytest.fail("worker não respondeu")
+
+
+def _visible_rows(page):
+    table = page.alerts_table
+    return [row for row in range(table.rowCount()) if not table.isRowHidden(row)]
+
+
+def _add_events(db_manager, count, event_type="intrusion"):
+    return [
+        db_manager.add_event(1, None, event_type, i, 0.9, "high")
+        for i in range(count)
+    ]
+
+
+class TestLoading:
+    """Carga inicial e atualização incremental"""
+
+    def test_first_show_loads_rows(self, page, db_manager):
+        event_id = _add_events(db_manager, 3)[0]
+        db_manager.execute_update("UPDATE events SET is_real = 0 WHERE id = ?", (event_id,))
+
+        page.show()
+        _wait(page)
+
+        assert len(_visible_rows(page)) == 3
+        statuses = {page.alerts_table.item(row, 5).text() for row in _visible_rows(page)}
+        assert statuses == {"Unreviewed", "False Positive"}
+        assert page.alerts_table.item(0, 4).text() == "90.00%"
+
+    def test_incremental_refresh_prepends_new_rows(self, page, db_manager):
+        _add_events(db_manager, 2)
+        page.show()
+        _wait(page)
+
+        new_id = db_manager.add_event(2, None, "theft", 9, 0.5, "low")
+        page._incremental_refresh()
+        _wait(page)
+
+        assert len(_visible_rows(page)) == 3
+        assert page.alerts_table.item(0, 0).data(Qt.UserRole) == new_id
+
+    def test_hidden_page_does_not_poll(self, page):
+        page.show()
+        _wait(page)
+        assert page.update_timer.isActive()
+        page.hide()
+        assert not page.update_timer.isActive()
+
+
+class TestPagination:
+    """Paginação no banco"""
+
+    def test_next_page(self, page, db_manager):
+        _add_events(db_manager, PAGE_SIZE + 5)
+        page.show()
+        _wait(page)
+        assert len(_visible_rows(page)) == PAGE_SIZE
+        assert page.page_label.text() == "Page 1 of 2"
+
+        page._go_next()
+        _wait(page)
+        assert len(_visible_rows(page)) == 5
+        assert not page.next_btn.isEnabled()
+
+
+class TestMarking:
+    """Marcação real / falso positivo"""
+
+    def test_marks_are_batched(self, page, db_manager):
+        first, second = _add_events(db_manager, 2)
+        page.show()
+        _wait(page)
+
+        page.mark_real(first)
+        page.mark_false_positive(second)
+        row = next(r for r in _visible_rows(page)
+                   if page.alerts_table.item(r, 0).data(Qt.UserRole) == first)
+        assert page.alerts_table.item(row, 5).text() == "Real"
+
+        page._flush_timer.stop()
+        page._flush_marks()
+        _wait(page)
+
+        rows = db_manager.execute_query("SELECT id, is_real FROM events ORDER BY id")
+        assert [tuple(r) for r in rows] == [(first, 1), (second, 0)]
+
+    def test_stop_fetcher_flushes_pending_marks(self, page, db_manager):
+        first, _ = _add_events(db_manager, 2)
+        page.show()
+        _wait(page)
+
+        page.mark_real(first)
+        assert page._flush_timer.isActive()
+        page.stop_fetcher()
+
+        rows = db_manager.execute_query("SELECT is_real FROM events WHERE id = ?", (first,))
+        assert rows[0][0] == 1
+        assert not page._flush_timer.isActive()
+
+    def test_mark_bulk_updates_selected_rows(self, page, db_manager):
+        ids = _add_events(db_manager, 3)
+        page.show()
+        _wait(page)
+
+        page.alerts_table.selectRow(0)
+        page.alerts_table.selectionModel().select(
+            page.alerts_table.model().index(2, 0),
+            page.alerts_table.selectionModel().SelectionFlag.Select
+            | page.alerts_table.selectionModel().SelectionFlag.Rows
+        )
+        page._mark_selected(False)
+
+        rows = db_manager.execute_query("SELECT id, is_real FROM events ORDER BY id")
+        assert [tuple(r) for r in rows] == [(ids[0], 0), (ids[1], None), (ids[2], 0)]
+        assert page.alerts_table.item(0, 5).text() == "False Positive"
+
+    def test_mark_bulk_with_status_filter_reloads(self, page, db_manager):
+        ids = _add_events(db_manager, 3)
+        db_manager.execute_update("UPDATE events SET is_real = 1")
+        page.status_filter.setCurrentText("Real")
+        page.show()
+        _wait(page)
+        assert len(_visible_rows(page)) == 3
+
+        page.mark_bulk([ids[0]], False)
+        _wait(page)
+
+        remaining = {page.alerts_table.item(r, 0).data(Qt.UserRole) for r in _visible_rows(page)}
+        assert remaining == {ids[1], ids[2]}
+
+
+class TestExport:
+    """Exportação CSV"""
+
+    def test_csv_contains_every_filtered_row(self, page, db_manager, tmp_path):
+        _add_events(db_manager, PAGE_SIZE * 2 + 1)
+        _add_events(db_manager, 3, event_type="theft")
+        page.event_type_filter.setCurrentText("intrusion")
+        _wait(page)
+
+        out = tmp_path / "alerts.csv"
+        page._write_csv(str(out))
+
+        lines = out.read_text().splitlines()
+        assert lines[0].startswith("Timestamp,Camera,Zone")
+        assert len(lines) == PAGE_SIZE * 2 + 2
+
+
+class TestSnapshot:
+    """Pré-visualização de snapshots"""
+
+    def test_snapshot_is_downscaled_and_cached(self, page, tmp_path):
+        from PySide6.QtGui import QImage, QPixmapCache
+
+        path = tmp_path / "snap.png"
+        image = QImage(1920, 1080, QImage.Format.Format_RGB32)
+        image.fill(Qt.GlobalColor.red)
+        image.save(str(path))
+
+        page.view_snapshot(str(path))
+        deadline = time.monotonic() + 3.0
+        while QPixmapCache.find(str(path)) is None and time.monotonic() < deadline:
+            QApplication.processEvents()
+            time.sleep(0.01)
+
+        pixmap = QPixmapCache.find(str(path))
+        assert pixmap is not None
+        assert (pixmap.width(), pixmap.height()) == (640, 360)
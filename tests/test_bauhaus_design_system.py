@@ -184,6 +184,43 @@ class TestBauhausComponents:
         from src.ui.bauhaus_components import BauhausFormField
         assert BauhausFormField is not None
 
+    def test_form_field_values(self):
+        """Verifica get_value/set_value de cada tipo de campo"""
+        from PySide6.QtWidgets import QApplication
+        from src.ui.bauhaus_components import (
+            BauhausFormField, BauhausComboField, BauhausDoubleField
+        )
+        app = QApplication.instance() or QApplication([])
+
+        text_field = BauhausFormField("Email")
+        text_field.set_value("a@b.com")
+        assert text_field.get_value() == "a@b.com"
+
+        combo_field = BauhausComboField("Tipo")
+        combo_field.input.addItems(["x", "y"])
+        combo_field.set_value("y")
+        assert combo_field.get_value() == "y"
+
+        double_field = BauhausDoubleField("Limite")
+        double_field.set_value(2.5)
+        assert double_field.get_value() == 2.5
+
+    def test_form_field_create_by_name(self):
+        """Verifica que create() escolhe o campo pelo nome do tipo"""
+        from PySide6.QtWidgets import QApplication
+        from src.ui.bauhaus_components import (
+            BauhausFormField, BauhausComboField, BauhausSpinField
+        )
+        app = QApplication.instance() or QApplication([])
+
+        assert type(BauhausFormField.create("Tipo", "combo")) is BauhausComboField
+        assert type(BauhausFormField.create("Qtd", input_type="spin")) is BauhausSpinField
+
+        fallback = BauhausFormField.create("Nome", "desconhecido")
+        assert type(fallback) is BauhausFormField
+        fallback.set_value("abc")
+        assert fallback.get_value() == "abc"
+
 
 class TestBauhausIntegration:
     """Testes de integração do design system"""
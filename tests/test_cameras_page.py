@@ -0,0 +1,105 @@
+"""
+Testes para a página de câmeras
+"""
+import sys
+import types
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from src.ui.pages import cameras_page
+from src.ui.pages.cameras_page import CamerasPage, _overlay_geometry
+
+
+@pytest.fixture
+def cameras():
+    return [
+        {"id": 1, "name": "Front", "rtsp_url": "rtsp://front"},
+        {"id": 2, "name": "Back", "rtsp_url": "rtsp://back"},
+    ]
+
+
+@pytest.fixture
+def page(qapp, cameras):
+    db_manager = Mock()
+    db_manager.get_cameras.side_effect = lambda user_id: list(cameras)
+    auth_manager = Mock()
+    auth_manager.get_user_id.return_value = 1
+    camera_manager = Mock()
+    camera_manager.get_camera_status.return_value = {"status": "online"}
+    return CamerasPage(db_manager, auth_manager, camera_manager, Mock())
+
+
+def _rows(page):
+    table = page.cameras_table
+    return [(table.item(row, 0).text(), table.item(row, 1).text()) for row in range(table.rowCount())]
+
+
+class TestRefresh:
+    """refresh() só mexe nas linhas que mudaram"""
+
+    def test_unchanged_rows_keep_widgets(self, page, cameras):
+        page.refresh()
+        view_btn = page.cameras_table.cellWidget(0, 5)
+
+        cameras[0]["name"] = "Front Door"
+        page.camera_manager.get_camera_status.return_value = {"status": "offline"}
+        page.refresh()
+
+        assert page.cameras_table.cellWidget(0, 5) is view_btn
+        assert _rows(page) == [("1", "Front Door"), ("2", "Back")]
+        assert page.cameras_table.item(1, 3).text() == "Offline"
+
+    def test_added_and_removed_cameras(self, page, cameras):
+        page.refresh()
+        del cameras[0]
+        cameras.append({"id": 3, "name": "Side", "rtsp_url": "rtsp://side"})
+        page.refresh()
+
+        assert _rows(page) == [("2", "Back"), ("3", "Side")]
+        assert page._row_ids == [2, 3]
+
+    def test_logout_clears_table(self, page):
+        page.refresh()
+        page.auth_manager.get_user_id.return_value = None
+        page.refresh()
+
+        assert page.cameras_table.rowCount() == 0
+        assert page._row_cache == {}
+
+
+def test_overlay_geometry():
+    boxes = np.array([[10, 50, 100, 200]], np.int32)
+    geometry = _overlay_geometry(boxes, np.array([11], np.int32))
+    assert geometry.tolist() == [[10, 24, 120, 50, 10, 45]]
+
+
+def test_failed_export_is_not_retried(tmp_path, monkeypatch):
+    exports = []
+
+    class FakeYOLO:
+        def __init__(self, path, task=None):
+            self.path = path
+
+        def export(self, **kwargs):
+            exports.append(kwargs["format"])
+            raise RuntimeError("openvino missing")
+
+    monkeypatch.setitem(sys.modules, "ultralytics", types.SimpleNamespace(YOLO=FakeYOLO))
+    monkeypatch.setattr(cameras_page, "MODELS_DIR", tmp_path)
+    monkeypatch.setattr(cameras_page, "_cuda_available", lambda: False)
+
+    for _ in range(2):
+        model = cameras_page._load_yolo_model()
+        assert model.path == cameras_page.YOLO_MODEL
+
+    assert exports == ["openvino"]
+    assert (tmp_path / "yolov8m_int8_openvino_model.failed").exists()
+
+
+def test_gstreamer_pipeline_quotes_url():
+    pipeline = cameras_page._gstreamer_pipeline('rtsp://u:p a"s\\s!@cam/stream')
+
+    assert pipeline.startswith('rtspsrc location="rtsp://u:p a\\"s\\\\s!@cam/stream" latency=100 ! ')
+    assert pipeline.endswith("appsink drop=1 max-buffers=1 sync=false")
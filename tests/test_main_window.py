@@ -0,0 +1,86 @@
+"""
+Testes de navegação da janela principal
+"""
+import time
+from unittest.mock import Mock
+
+import pytest
+from PySide6.QtWidgets import QApplication
+
+from src.core.alert_manager import AlertManager
+from src.core.auth import AuthManager
+from src.core.camera_manager import CameraManager
+from src.core.database import DatabaseManager
+from src.ui.main_window import MainWindow
+
+
+@pytest.fixture
+def window(qapp, tmp_path):
+    db = DatabaseManager(tmp_path / "app.db")
+    auth = AuthManager(db, None)
+    auth.register_user("bob", "Secret123!", "bob@example.com")
+    alert_manager = AlertManager(db)
+    engine_manager = Mock(is_running=False)
+    window = MainWindow(auth, db, alert_manager, CameraManager(db, alert_manager), engine_manager, {})
+    assert auth.login("bob", "Secret123!")
+    window.on_login_success()
+    yield window
+    window.navigate_to_page("logout")
+    alerts_page = window._pages.get("alerts")
+    if alerts_page is not None:
+        alerts_page.stop_fetcher()
+    window.allow_close = True
+    window.close()
+    db.disconnect()
+
+
+def _wait_idle(page, timeout=3.0):
+    """Processa eventos até a página de alertas terminar as consultas"""
+    app = QApplication.instance()
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        app.processEvents()
+        if not page._in_flight:
+            app.processEvents()
+            return
+        time.sleep(0.01)
+    pytest.fail("worker não respondeu")
+
+
+class TestNavigation:
+    """Troca de páginas"""
+
+    def test_profile_shows_logged_in_user(self, window):
+        window.navigate_to_page("profile")
+
+        assert window.page_title.text() == "Profile"
+        assert window.get_page("profile").username_label.text() == "bob"
+        assert window.get_page("profile").current_email_label.text() == "bob@example.com"
+
+    def test_logout_drops_pending_alert_notice(self, window, qapp):
+        window.alert_manager.create_alert(0, 1, "intrusion", "high")
+        qapp.processEvents()
+        assert window._coalesce_timer.isActive()
+
+        window.navigate_to_page("logout")
+
+        assert not window._coalesce_timer.isActive()
+        assert window._new_alert_count == 0
+        assert window._last_new_alert is None
+
+    def test_alerts_navigation_queries_once(self, window, qapp):
+        window.show()
+        window.navigate_to_page("alerts")
+        page = window.get_page("alerts")
+        _wait_idle(page)
+        window.navigate_to_page("dashboard")
+        window._clean_pages.discard("alerts")
+
+        modes = []
+        original = page._request_fetch
+        page._request_fetch = lambda mode, query, params: (modes.append(mode), original(mode, query, params))
+        window.navigate_to_page("alerts")
+        _wait_idle(page)
+
+        assert modes.count("full") == 1
+        assert "incremental" not in modes
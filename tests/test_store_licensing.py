@@ -4,7 +4,10 @@ Testes para Store Licensing
 import pytest
 from unittest.mock import Mock, MagicMock, patch
 from datetime import datetime, timedelta
+import asyncio
+import sqlite3
 from src.core.license_manager import LicenseManager
+from src.core.store_licensing import AsyncLicenseManager
 
 
 @pytest.fixture
@@ -13,6 +16,12 @@ def mock_db_manager():
     db = Mock()
     db.get_license = Mock(return_value=None)
     db.get_camera_limit = Mock(return_value=2)
+    db.get_license_bundle = Mock(return_value={
+        'license_key': 'TRIAL-KEY',
+        'expiration_date': (datetime.now() + timedelta(days=7)).isoformat(),
+        'camera_limit': 2,
+        'is_trial': True
+    })
     db.add_license = Mock(return_value=1)
     return db
 
@@ -56,7 +65,7 @@ class TestLicenseManager:
     def test_validate_license_local_valid(self, license_manager_local, mock_db_manager):
         """Testa validação de licença local válida"""
         future_date = (datetime.now() + timedelta(days=30)).isoformat()
-        mock_db_manager.get_license.return_value = {
+        mock_db_manager.get_license_bundle.return_value = {
             'license_key': 'TEST-KEY',
             'expiration_date': future_date,
             'camera_limit': 2,
@@ -70,7 +79,7 @@ class TestLicenseManager:
     def test_validate_license_local_expired(self, license_manager_local, mock_db_manager):
         """Testa validação de licença local expirada"""
         past_date = (datetime.now() - timedelta(days=1)).isoformat()
-        mock_db_manager.get_license.return_value = {
+        mock_db_manager.get_license_bundle.return_value = {
             'license_key': 'TEST-KEY',
             'expiration_date': past_date,
             'camera_limit': 2,
@@ -83,7 +92,7 @@ class TestLicenseManager:
 
     def test_validate_license_not_found(self, license_manager_local, mock_db_manager):
         """Testa validação quando licença não existe"""
-        mock_db_manager.get_license.return_value = None
+        mock_db_manager.get_license_bundle.return_value = None
         
         is_valid = license_manager_local.validate_license(user_id=1)
         
@@ -109,7 +118,12 @@ class TestLicenseManager:
 
     def test_get_camera_limit_local(self, license_manager_local, mock_db_manager):
         """Testa obtenção de limite local"""
-        mock_db_manager.get_camera_limit.return_value = 5
+        mock_db_manager.get_license_bundle.return_value = {
+            'license_key': 'TIER1-KEY',
+            'expiration_date': (datetime.now() + timedelta(days=30)).isoformat(),
+            'camera_limit': 5,
+            'is_trial': False
+        }
         
         limit = license_manager_local.get_camera_limit(user_id=1)
         
@@ -128,7 +142,7 @@ class TestLicenseManager:
     def test_get_license_info_local_trial(self, license_manager_local, mock_db_manager):
         """Testa obtenção de info de licença trial local"""
         future_date = (datetime.now() + timedelta(days=5)).isoformat()
-        mock_db_manager.get_license.return_value = {
+        mock_db_manager.get_license_bundle.return_value = {
             'license_key': 'TRIAL-KEY',
             'expiration_date': future_date,
             'camera_limit': 2,
@@ -159,7 +173,7 @@ class TestLicenseManager:
     def test_get_upgrade_message_trial(self, license_manager_local, mock_db_manager):
         """Testa mensagem de upgrade para trial"""
         future_date = (datetime.now() + timedelta(days=3)).isoformat()
-        mock_db_manager.get_license.return_value = {
+        mock_db_manager.get_license_bundle.return_value = {
             'license_key': 'TRIAL-KEY',
             'expiration_date': future_date,
             'camera_limit': 2,
@@ -174,7 +188,7 @@ class TestLicenseManager:
     def test_get_upgrade_message_tier1(self, license_manager_local, mock_db_manager):
         """Testa mensagem de upgrade para Tier 1"""
         future_date = (datetime.now() + timedelta(days=365)).isoformat()
-        mock_db_manager.get_license.return_value = {
+        mock_db_manager.get_license_bundle.return_value = {
             'license_key': 'TIER1-KEY',
             'expiration_date': future_date,
             'camera_limit': 5,
@@ -188,7 +202,7 @@ class TestLicenseManager:
     def test_get_upgrade_message_enterprise(self, license_manager_local, mock_db_manager):
         """Testa mensagem para plano enterprise"""
         future_date = (datetime.now() + timedelta(days=365)).isoformat()
-        mock_db_manager.get_license.return_value = {
+        mock_db_manager.get_license_bundle.return_value = {
             'license_key': 'ENT-KEY',
             'expiration_date': future_date,
             'camera_limit': 50,
@@ -205,7 +219,7 @@ class TestLicenseManager:
         license_mgr.store_provider = mock_store_provider
         
         # Mesmo que DB retorne inválido, Store retorna válido
-        mock_db_manager.get_license.return_value = None
+        mock_db_manager.get_license_bundle.return_value = None
         
         is_valid = license_mgr.validate_license(user_id=1)
         
@@ -214,7 +228,7 @@ class TestLicenseManager:
 
     def test_get_camera_limit_fallback_on_error(self, license_manager_local, mock_db_manager):
         """Testa fallback para FREE_CAMERA_LIMIT em caso de erro"""
-        mock_db_manager.get_camera_limit.side_effect = Exception("DB Error")
+        mock_db_manager.get_license_bundle.side_effect = sqlite3.Error("DB Error")
         
         limit = license_manager_local.get_camera_limit(user_id=1)
         
@@ -241,10 +255,62 @@ class TestLicenseManager:
         # Deve retornar False (chave inválida) mas não dar erro
         assert isinstance(success, bool)
 
+    def test_license_read_once_per_request(self, license_manager_local, mock_db_manager):
+        """Testa que validação, limite e info compartilham uma única leitura"""
+        license_manager_local.validate_license(user_id=1)
+        license_manager_local.get_camera_limit(user_id=1)
+        license_manager_local.get_license_info(user_id=1)
+
+        assert mock_db_manager.get_license_bundle.call_count == 1
+
     def test_license_info_none_when_not_found(self, license_manager_local, mock_db_manager):
         """Testa que retorna None quando licença não encontrada"""
-        mock_db_manager.get_license.return_value = None
+        mock_db_manager.get_license_bundle.return_value = None
         
         info = license_manager_local.get_license_info(user_id=1)
         
         assert info is None
+
+    def test_verify_license_key_caches_positive_result(self, license_manager_local, mock_db_manager):
+        """Testa que chave verificada não consulta o banco novamente"""
+        mock_db_manager.execute_query = Mock(return_value=[(1,)])
+        license_key = "COMMERCIAL-0123456789ABCDEF"
+
+        assert license_manager_local.verify_license_key(license_key) is True
+        assert license_manager_local.verify_license_key(license_key) is True
+        assert mock_db_manager.execute_query.call_count == 1
+
+
+class TestAsyncLicenseManager:
+    """Testes para Async License Manager"""
+
+    def test_refresh_respects_ttl(self):
+        """Testa que chamadas dentro do TTL não consultam a Store novamente"""
+        manager = AsyncLicenseManager(is_store_build=False)
+
+        async def run():
+            with patch.object(manager.provider, 'get_app_license', wraps=manager.provider.get_app_license) as app_mock:
+                await asyncio.gather(manager.refresh(), manager.refresh())
+                await manager.is_valid()
+                assert app_mock.call_count == 1
+
+                await manager.refresh(force=True)
+                assert app_mock.call_count == 2
+
+        asyncio.run(run())
+
+    def test_get_full_state_single_refresh(self):
+        """Testa que o estado completo é obtido com uma única atualização"""
+        manager = AsyncLicenseManager(is_store_build=False)
+
+        async def run():
+            with patch.object(manager, 'refresh', wraps=manager.refresh) as refresh_mock:
+                state = await manager.get_full_state()
+                assert refresh_mock.call_count == 1
+            return state
+
+        state = asyncio.run(run())
+
+        assert state['is_valid'] is True
+        assert state['cameras_available'] == 2
+        assert state['status'] == "Trial (Local)"